@@ -22,6 +22,7 @@ from test_helpers import (
     execute_command,
     get_tree,
     goto_url,
+    load_reference_image,
     read_JSON_message,
     send_JSON_command,
 )
@@ -38,7 +39,10 @@ from test_helpers import (
 )
 async def test_screenshot(websocket, context_id, png_filename):
     with open(Path(__file__).parent.resolve() / png_filename, "rb") as image_file:
-        png_base64 = base64.b64encode(image_file.read()).decode("utf-8")
+        png_bytes = image_file.read()
+        # Decode the reference before the file is overwritten with the screenshot.
+        reference_image = load_reference_image(png_bytes)
+        png_base64 = base64.b64encode(png_bytes).decode("utf-8")
 
         await goto_url(websocket, context_id, f"data:image/png;base64,{png_base64}")
 
@@ -72,7 +76,7 @@ async def test_screenshot(websocket, context_id, png_filename):
         with open(Path(__file__).parent.resolve() / png_filename, "wb") as im:
             im.write(base64.b64decode(resp["result"]["data"]))
 
-        assert_images_similar(resp["result"]["data"], png_base64)
+        assert_images_similar(resp["result"]["data"], reference_image)
 
 
 @pytest.mark.asyncio
@@ -110,10 +114,10 @@ async def test_screenshot_element(websocket, context_id, query_selector, html):
     resp = await read_JSON_message(websocket)
     assert resp["result"] == {"data": ANY_STR}
 
-    with open(Path(__file__).parent.resolve() / "element.png", "rb") as image_file:
-        assert_images_similar(
-            resp["result"]["data"], base64.b64encode(image_file.read()).decode("utf-8")
-        )
+    assert_images_similar(
+        resp["result"]["data"],
+        load_reference_image(Path(__file__).parent.resolve() / "element.png"),
+    )
 
 
 @pytest.mark.asyncio
@@ -156,11 +160,10 @@ async def test_screenshot_oopif(websocket, context_id, html, iframe):
     resp = await read_JSON_message(websocket)
     assert resp["result"] == {"data": ANY_STR}
 
-    png_filename = "oopif.png"
-    with open(Path(__file__).parent.resolve() / png_filename, "rb") as image_file:
-        png_base64 = base64.b64encode(image_file.read()).decode("utf-8")
-
-        assert_images_similar(resp["result"]["data"], png_base64)
+    assert_images_similar(
+        resp["result"]["data"],
+        load_reference_image(Path(__file__).parent.resolve() / "oopif.png"),
+    )
 
 
 @pytest.mark.asyncio
@@ -203,12 +206,10 @@ async def test_screenshot_document(websocket, context_id, query_selector, html):
     resp = await read_JSON_message(websocket)
     assert resp["result"] == {"data": ANY_STR}
 
-    with open(
-        Path(__file__).parent.resolve() / "element-document.png", "rb"
-    ) as image_file:
-        assert_images_similar(
-            resp["result"]["data"], base64.b64encode(image_file.read()).decode("utf-8")
-        )
+    assert_images_similar(
+        resp["result"]["data"],
+        load_reference_image(Path(__file__).parent.resolve() / "element-document.png"),
+    )
 
 
 @pytest.mark.asyncio
@@ -300,9 +301,7 @@ async def test_screenshot_viewport_clip_scroll(
 
     assert resp == {"data": ANY_STR}
 
-    with open(
-        Path(__file__).parent.resolve() / "element-document.png", "rb"
-    ) as image_file:
-        assert_images_similar(
-            resp["data"], base64.b64encode(image_file.read()).decode("utf-8")
-        )
+    assert_images_similar(
+        resp["data"],
+        load_reference_image(Path(__file__).parent.resolve() / "element-document.png"),
+    )
@@ -23,11 +23,14 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 import websockets
+from snapshot_extension import CanonicalJSONSnapshotExtension
 from test_helpers import (
     AnyExtending,
+    connect_websocket,
     execute_command,
     get_tree,
     goto_url,
+    harness_counters,
     merge_dicts_recursively,
     read_JSON_message,
     send_JSON_command,
@@ -41,7 +44,14 @@ from tools.local_http_server import LocalHttpServer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-pytest_plugins = ["resultsink_reporter"]
+pytest_plugins = [
+    "resultsink_reporter",
+    "memory_tracker",
+    "harness_profiler",
+    "mapper_profiler",
+    "impact_recorder",
+    "flaky_rerunner",
+]
 
 GOOD_SSL_CERT_SPKI = "QQDsUATYj6FX2oHvQ5/cyDW9CutD2sp9z+qeLfNGHHw="
 
@@ -106,6 +116,12 @@ def http_proxy_server() -> HttpProxyServer:
     return server
 
 
+@pytest.fixture
+def snapshot(snapshot):
+    """Stores the snapshots as canonical JSON, see `snapshot_extension.py`."""
+    return snapshot.use_extension(CanonicalJSONSnapshotExtension)
+
+
 @pytest_asyncio.fixture
 async def test_headless_mode():
     """Return the headless mode to use for the test. The default is "new" mode."""
@@ -136,7 +152,70 @@ async def current_test_name(request):
 
 
 @pytest_asyncio.fixture
-async def websocket(test_headless_mode, capabilities, current_test_name):
+async def session_capabilities(
+    test_headless_mode, capabilities, current_test_name, mapper_debugging_port
+):
+    """Return the capabilities to create a new session with."""
+    default_capabilities = {
+        "webSocketUrl": True,
+        "goog:chromeOptions": {
+            "args": [
+                # Required for navigating to `local_server_good_ssl`.
+                f"--ignore-certificate-errors-spki-list={GOOD_SSL_CERT_SPKI}",
+                "--disable-infobars",
+                # Required to prevent automatic switch to https.
+                "--disable-features=HttpsFirstBalancedModeAutoEnable,HttpsUpgrades,LocalNetworkAccessChecks",
+                # Required for bluetooth testing.
+                # Required for digital credentials testing.
+                "--enable-features=WebBluetooth,WebIdentityDigitalCredentials",
+                # Prevent throttling.
+                "--disable-background-networking",
+                "--disable-background-timer-throttling",
+                "--disable-backgrounding-occluded-windows",
+            ]
+        },
+        # Add test name to ease log analyse.
+        "goog:pytest_name": current_test_name,
+    }
+
+    maybe_browser_bin = os.getenv("BROWSER_BIN")
+    if maybe_browser_bin:
+        default_capabilities["goog:chromeOptions"]["binary"] = maybe_browser_bin
+
+    if test_headless_mode != "false":
+        if test_headless_mode == "old":
+            default_capabilities["goog:chromeOptions"]["args"].extend(
+                [
+                    # No need in `--headless=old` flag, as it will be handled by
+                    # `BROWSER_BIN` environment variable.
+                    "--hide-scrollbars",
+                    "--mute-audio",
+                ]
+            )
+        else:
+            # Default to new headless mode.
+            default_capabilities["goog:chromeOptions"]["args"].append("--headless=new")
+
+    if mapper_debugging_port is not None:
+        # Required to profile the mapper, see `mapper_profiler.py`.
+        default_capabilities["goog:chromeOptions"]["args"].append(
+            f"--remote-debugging-port={mapper_debugging_port}"
+        )
+
+    return merge_dicts_recursively(default_capabilities, capabilities)
+
+
+@pytest.fixture
+def websocket_options() -> dict:
+    """
+    Options of `connect_websocket` for the `websocket` fixture. Overridden by the
+    tests receiving messages larger than the default `max_size`.
+    """
+    return {}
+
+
+@pytest_asyncio.fixture
+async def websocket(session_capabilities, websocket_options):
     """Connects to endpoint, creates a session and returns a websocket connection."""
 
     async def create_session(connection):
@@ -144,52 +223,6 @@ async def websocket(test_headless_mode, capabilities, current_test_name):
         Creates a new session on the given connection. It can time out due to
         GitHub infra issues.
         """
-        default_capabilities = {
-            "webSocketUrl": True,
-            "goog:chromeOptions": {
-                "args": [
-                    # Required for navigating to `local_server_good_ssl`.
-                    f"--ignore-certificate-errors-spki-list={GOOD_SSL_CERT_SPKI}",
-                    "--disable-infobars",
-                    # Required to prevent automatic switch to https.
-                    "--disable-features=HttpsFirstBalancedModeAutoEnable,HttpsUpgrades,LocalNetworkAccessChecks",
-                    # Required for bluetooth testing.
-                    # Required for digital credentials testing.
-                    "--enable-features=WebBluetooth,WebIdentityDigitalCredentials",
-                    # Prevent throttling.
-                    "--disable-background-networking",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                ]
-            },
-            # Add test name to ease log analyse.
-            "goog:pytest_name": current_test_name,
-        }
-
-        maybe_browser_bin = os.getenv("BROWSER_BIN")
-        if maybe_browser_bin:
-            default_capabilities["goog:chromeOptions"]["binary"] = maybe_browser_bin
-
-        if test_headless_mode != "false":
-            if test_headless_mode == "old":
-                default_capabilities["goog:chromeOptions"]["args"].extend(
-                    [
-                        # No need in `--headless=old` flag, as it will be handled by
-                        # `BROWSER_BIN` environment variable.
-                        "--hide-scrollbars",
-                        "--mute-audio",
-                    ]
-                )
-            else:
-                # Default to new headless mode.
-                default_capabilities["goog:chromeOptions"]["args"].append(
-                    "--headless=new"
-                )
-
-        session_capabilities = merge_dicts_recursively(
-            default_capabilities, capabilities
-        )
-
         await execute_command(
             connection,
             {
@@ -207,8 +240,9 @@ async def websocket(test_headless_mode, capabilities, current_test_name):
         current_attempt = 0
         max_attempt = 5
         while True:
+            harness_counters["session_creation_attempts"] += 1
             try:
-                connection = await connect_websocket()
+                connection = await connect_websocket(**websocket_options)
                 await create_session(connection)
                 return connection
             except (asyncio.exceptions.CancelledError, asyncio.TimeoutError) as e:
@@ -233,14 +267,6 @@ async def websocket(test_headless_mode, capabilities, current_test_name):
                         f"Error during connecting. Attempts: {current_attempt}/{max_attempt}. {e}"
                     )
 
-    async def connect_websocket():
-        """Return a websocket connection to the browser on localhost without an
-        active BiDi session.
-        """
-        port = os.getenv("PORT", 8080)
-        url = f"ws://localhost:{port}/session"
-        return await websockets.connect(url)
-
     _websocket_connection = await connect_and_create_new_session()
 
     yield _websocket_connection
@@ -0,0 +1,173 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+import time
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+CREATE_RESULTS_TABLE = """
+CREATE TABLE IF NOT EXISTS results (
+    nodeid TEXT NOT NULL,
+    finished REAL NOT NULL,
+    attempts INTEGER NOT NULL,
+    outcome TEXT NOT NULL
+)
+"""
+
+
+def is_failure(report) -> bool:
+    return report.failed and not hasattr(report, "wasxfail")
+
+
+def get_flake_stats(
+    connection: sqlite3.Connection, nodeids: list[str]
+) -> dict[str, tuple[int, int]]:
+    """
+    Return the number of recorded runs and of flaky runs of the given tests.
+
+    >>> connection = sqlite3.connect(":memory:")
+    >>> _ = connection.execute(CREATE_RESULTS_TABLE)
+    >>> _ = connection.executemany(
+    ...     "INSERT INTO results VALUES (?, 0, ?, ?)",
+    ...     [("a", 1, "passed"), ("a", 2, "flaky"), ("a", 3, "failed"),
+    ...      ("b", 1, "passed")])
+    >>> get_flake_stats(connection, ["a", "c"])
+    {'a': (3, 1)}
+    """
+    placeholders = ",".join("?" * len(nodeids))
+    rows = connection.execute(
+        "SELECT nodeid, COUNT(*), SUM(outcome = 'flaky') FROM results "
+        f"WHERE nodeid IN ({placeholders}) GROUP BY nodeid",
+        nodeids,
+    )
+    return {nodeid: (runs, flaky) for nodeid, runs, flaky in rows}
+
+
+class DeferredRerunner:
+    """
+    Reruns the failed tests at the end of the session instead of right after
+    the failure. Each rerun tears down all the fixtures, including the session
+    ones, so that the test runs on a fresh BiDi session and browser, and on
+    fresh local servers.
+
+    The outcome and the number of attempts of each test are recorded in a
+    SQLite database, so that the flake rate of a test can be tracked over runs.
+    """
+
+    def __init__(self, max_reruns: int, db_path: str):
+        self.max_reruns = max_reruns
+        self.db_path = db_path
+        self.deferred: list[pytest.Item] = []
+        self.attempts: dict[str, int] = {}
+        # Node id, finish time, attempts and outcome of each test.
+        self.results: list[tuple[str, float, int, str]] = []
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        attempt = self.attempts.get(item.nodeid, 0) + 1
+        self.attempts[item.nodeid] = attempt
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        failed = any(is_failure(report) for report in reports)
+        if failed and attempt <= self.max_reruns:
+            for report in reports:
+                if is_failure(report):
+                    report.outcome = "rerun"
+            self.deferred.append(item)
+        else:
+            if failed:
+                outcome = "failed"
+            elif attempt > 1:
+                outcome = "flaky"
+            elif any(report.skipped for report in reports):
+                outcome = "skipped"
+            else:
+                outcome = "passed"
+            self.results.append((item.nodeid, time.time(), attempt, outcome))
+        for report in reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtestloop(self, session):
+        yield
+        # Rerun in rounds, so that the reruns of a test are spaced out.
+        while self.deferred and not (session.shouldfail or session.shouldstop):
+            items, self.deferred = self.deferred, []
+            for item in items:
+                item.ihook.pytest_runtest_protocol(item=item, nextitem=None)
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not self.results:
+            return
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute(CREATE_RESULTS_TABLE)
+            connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?)", self.results
+            )
+        connection.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        flaky = [nodeid for nodeid, _, _, outcome in self.results if outcome == "flaky"]
+        if not flaky:
+            return
+        terminalreporter.section("flaky tests")
+        with sqlite3.connect(self.db_path) as connection:
+            stats = get_flake_stats(connection, flaky)
+        connection.close()
+        for nodeid in flaky:
+            runs, flaky_runs = stats[nodeid]
+            terminalreporter.write_line(
+                f"{nodeid} passed after {self.attempts[nodeid]} attempts, "
+                f"flaky in {flaky_runs} of {runs} recorded runs"
+            )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("deferred reruns")
+    group.addoption(
+        "--deferred-reruns",
+        type=int,
+        default=0,
+        help="Number of times to rerun a failed test at the end of the session, "
+        "on fresh fixtures.",
+    )
+    group.addoption(
+        "--flake-db",
+        help="SQLite database to record the outcome and the attempts of each "
+        "test to. Defaults to `flakes.sqlite` in `LOG_DIR` or `logs`.",
+    )
+
+
+def pytest_configure(config):
+    max_reruns = config.getoption("--deferred-reruns")
+    if not max_reruns:
+        return
+    db_path = config.getoption("--flake-db") or os.path.join(
+        os.environ.get("LOG_DIR", "logs"), "flakes.sqlite"
+    )
+    config.pluginmanager.register(
+        DeferredRerunner(max_reruns, db_path), "flaky_rerunner_plugin"
+    )
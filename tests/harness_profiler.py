@@ -0,0 +1,167 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import signal
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# Shorter tests are not flagged, as their CPU time is not measured precisely.
+MIN_FLAGGED_WALL_TIME = 0.1
+
+
+def get_profile_file_name(nodeid: str, extension: str = ".folded") -> str:
+    """
+    Return the name of the profile file of the given test.
+
+    >>> get_profile_file_name("tests/script/test_a.py::test_b[param/1]")
+    'tests_script_test_a.py__test_b_param_1_.folded'
+    """
+    return re.sub(r"[^\w.-]", "_", nodeid) + extension
+
+
+def get_frame_label(frame) -> str:
+    code = frame.f_code
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+def collapse_stack(frame) -> str:
+    """Return the stack of the given frame in the collapsed format, root first."""
+    labels = []
+    while frame is not None:
+        labels.append(get_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class HarnessProfiler:
+    """
+    Samples the Python stack of the main thread on a CPU-time timer while each
+    test runs, including its setup and teardown. The samples are written per
+    test in the collapsed-stack format, which can be rendered by flame graph
+    tools, e.g. `flamegraph.pl` or speedscope.
+
+    As the timer counts the CPU time of the process, the number of samples
+    reflects the CPU time spent by the harness, e.g. in JSON decoding, snapshot
+    matching or image diffing, as opposed to waiting for the browser. Threads
+    other than the main thread, e.g. the local HTTP server, are accounted in
+    the CPU time but not sampled.
+    """
+
+    def __init__(self, output_dir: Path, interval: float, threshold_percent: float):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.threshold_percent = threshold_percent
+        self.stacks: Counter[str] = Counter()
+        # Node id, harness CPU time in seconds and wall time in seconds.
+        self.records: list[tuple[str, float, float]] = []
+
+    def _handle_sample(self, signum, frame):
+        self.stacks[collapse_stack(frame)] += 1
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.stacks = Counter()
+        previous_handler = signal.signal(signal.SIGPROF, self._handle_sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+        cpu_time = time.process_time() - start_cpu_time
+        wall_time = time.perf_counter() - start_wall_time
+        self.records.append((item.nodeid, cpu_time, wall_time))
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / get_profile_file_name(item.nodeid), "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def get_flagged_tests(self) -> list[tuple[str, float, float]]:
+        return [
+            record
+            for record in self.records
+            if record[2] >= MIN_FLAGGED_WALL_TIME
+            and record[1] / record[2] * 100 > self.threshold_percent
+        ]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section("harness profile")
+        terminalreporter.write_line(f"Collapsed stacks written to {self.output_dir}")
+        for nodeid, cpu_time, wall_time in sorted(
+            self.get_flagged_tests(), key=lambda record: record[1], reverse=True
+        ):
+            terminalreporter.write_line(
+                f"Harness CPU time of {nodeid}: {cpu_time:.2f}s of {wall_time:.2f}s "
+                f"({cpu_time / wall_time * 100:.0f}%)"
+            )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("harness profiler")
+    group.addoption(
+        "--profile-harness",
+        action="store_true",
+        help="Sample the Python stack of the harness during each test and write "
+        "collapsed-stack files per test.",
+    )
+    group.addoption(
+        "--profile-harness-dir",
+        default="harness-profiles",
+        help="Directory to write the collapsed-stack files to.",
+    )
+    group.addoption(
+        "--profile-harness-interval",
+        type=float,
+        default=5,
+        help="Sampling interval in milliseconds of CPU time.",
+    )
+    group.addoption(
+        "--profile-harness-threshold",
+        type=float,
+        default=30,
+        help="Harness CPU time in percent of the wall time to flag a test.",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--profile-harness"):
+        return
+    if sys.platform == "win32":
+        config.issue_config_time_warning(
+            pytest.PytestConfigWarning(
+                "Harness profiling requires `SIGPROF`. Skipping."
+            ),
+            stacklevel=2,
+        )
+        return
+    config.pluginmanager.register(
+        HarnessProfiler(
+            Path(config.getoption("--profile-harness-dir")),
+            config.getoption("--profile-harness-interval") / 1000,
+            config.getoption("--profile-harness-threshold"),
+        ),
+        "harness_profiler_plugin",
+    )
@@ -0,0 +1,61 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from test_helpers import CountingWebSocketClientProtocol
+
+
+class ImpactRecorder:
+    """
+    Records the BiDi methods of the commands sent and of the events received by
+    each test, including its setup and teardown. The records are used by
+    `tools/select_e2e_tests.py` to select the tests affected by a change.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.methods: set[str] = set()
+        # Sorted methods by the test node id.
+        self.records: dict[str, list[str]] = {}
+        CountingWebSocketClientProtocol.recorded_methods = self.methods
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self.methods.clear()
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self.records[nodeid] = sorted(self.methods)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        CountingWebSocketClientProtocol.recorded_methods = None
+        with open(self.output_file, "w") as f:
+            json.dump(self.records, f, indent=2, sort_keys=True)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact recorder")
+    group.addoption(
+        "--record-impact",
+        metavar="PATH",
+        help="JSON file to write the BiDi methods and events used by each test "
+        "to, for `tools/select_e2e_tests.py`.",
+    )
+
+
+def pytest_configure(config):
+    output_file = config.getoption("--record-impact")
+    if not output_file:
+        return
+    config.pluginmanager.register(ImpactRecorder(output_file), "impact_recorder_plugin")
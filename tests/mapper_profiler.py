@@ -0,0 +1,169 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+import urllib.request
+from itertools import count
+from pathlib import Path
+
+import pytest
+import websockets
+from harness_profiler import get_profile_file_name
+from tools.local_http_server import find_free_port
+
+logger = logging.getLogger(__name__)
+
+# Title of the mapper tab, see `src/bidiTab/mapperTabPage.ts`.
+MAPPER_TAB_TITLE = "BiDi-CDP Mapper"
+
+
+def find_mapper_target(targets: list[dict]) -> dict | None:
+    """
+    Return the mapper tab from the targets listed by the DevTools HTTP endpoint.
+
+    >>> find_mapper_target([{"type": "page", "title": "a", "url": "about:blank"},
+    ...     {"type": "page", "title": "b", "url": "about:blank#MAPPER_TARGET"}])
+    {'type': 'page', 'title': 'b', 'url': 'about:blank#MAPPER_TARGET'}
+    >>> find_mapper_target([{"type": "page", "title": "a", "url": "about:blank"}])
+    """
+    for target in targets:
+        if target["type"] == "page" and (
+            target["title"] == MAPPER_TAB_TITLE or "MAPPER_TARGET" in target["url"]
+        ):
+            return target
+    return None
+
+
+class MapperProfile:
+    """
+    V8 CPU profile of the mapper tab, recorded over a direct CDP connection to
+    the browser's remote debugging port. The mapper does not see this
+    connection, so the profile does not interfere with its CDP sessions.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.ids = count(1)
+
+    @classmethod
+    async def start(cls, port: int, sampling_interval_us: int) -> "MapperProfile":
+        with urllib.request.urlopen(f"http://localhost:{port}/json/list") as response:
+            target = find_mapper_target(json.load(response))
+        if target is None:
+            raise Exception("Mapper tab not found")
+        profile = cls(
+            await websockets.connect(target["webSocketDebuggerUrl"], max_size=None)
+        )
+        await profile.send_command("Profiler.enable")
+        await profile.send_command(
+            "Profiler.setSamplingInterval", {"interval": sampling_interval_us}
+        )
+        await profile.send_command("Profiler.start")
+        return profile
+
+    async def send_command(self, method: str, params: dict | None = None) -> dict:
+        command_id = next(self.ids)
+        await self.connection.send(
+            json.dumps({"id": command_id, "method": method, "params": params or {}})
+        )
+        while True:
+            message = json.loads(await self.connection.recv())
+            if message.get("id") == command_id:
+                if "error" in message:
+                    raise Exception(message["error"])
+                return message["result"]
+
+    async def stop(self, output_file: Path):
+        try:
+            result = await self.send_command("Profiler.stop")
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, "w") as f:
+                json.dump(result["profile"], f)
+        finally:
+            await self.connection.close()
+
+
+@pytest.fixture
+def mapper_debugging_port(request) -> int | None:
+    """Remote debugging port of the browser if the mapper is profiled."""
+    if not request.config.getoption("--profile-mapper"):
+        return None
+    return find_free_port()
+
+
+@pytest.fixture(autouse=True)
+def mapper_cpu_profile(request):
+    """
+    Records a CPU profile of the mapper during each test using a BiDi session.
+    The profile covers the test and the fixtures set up after the session.
+    """
+    if (
+        not request.config.getoption("--profile-mapper")
+        or "websocket" not in request.fixturenames
+    ):
+        yield
+        return
+
+    # Create the session and the browser now, so that the profile is stopped
+    # before the session is ended. The fixture is synchronous, as the async
+    # fixtures cannot be requested from a running event loop.
+    request.getfixturevalue("websocket")
+    event_loop = request.getfixturevalue("event_loop")
+    try:
+        profile = event_loop.run_until_complete(
+            MapperProfile.start(
+                request.getfixturevalue("mapper_debugging_port"),
+                request.config.getoption("--profile-mapper-interval"),
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Cannot profile the mapper: {e}")
+        yield
+        return
+
+    yield
+
+    output_dir = Path(
+        request.config.getoption("--profile-mapper-dir")
+        or os.environ.get("LOG_DIR", "logs")
+    )
+    event_loop.run_until_complete(
+        profile.stop(
+            output_dir / get_profile_file_name(request.node.nodeid, ".cpuprofile")
+        )
+    )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("mapper profiler")
+    group.addoption(
+        "--profile-mapper",
+        action="store_true",
+        help="Record a V8 CPU profile of the mapper tab during each test. Opens "
+        "a remote debugging port in the browser.",
+    )
+    group.addoption(
+        "--profile-mapper-dir",
+        help="Directory to write the `.cpuprofile` files to. Defaults to "
+        "`LOG_DIR` or `logs`, next to the test logs.",
+    )
+    group.addoption(
+        "--profile-mapper-interval",
+        type=int,
+        default=100,
+        help="Sampling interval in microseconds.",
+    )
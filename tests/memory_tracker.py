@@ -0,0 +1,225 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def parse_ps_output(output: str) -> dict[int, tuple[int, int]]:
+    """
+    Parse the output of `ps -A -o pid=,ppid=,rss=` into a map from the process
+    id to its parent process id and its RSS in KB.
+
+    >>> parse_ps_output("    1     0   100\\n   42     1  2048\\n")
+    {1: (0, 100), 42: (1, 2048)}
+    """
+    processes = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 3:
+            pid, ppid, rss = map(int, parts)
+            processes[pid] = (ppid, rss)
+    return processes
+
+
+def get_tree_rss(processes: dict[int, tuple[int, int]], root_pid: int):
+    """
+    Return the RSS of the root process and the total RSS of its descendants.
+
+    >>> get_tree_rss({1: (0, 100), 2: (1, 200), 3: (2, 300), 4: (0, 400)}, 1)
+    (100, 500)
+    >>> get_tree_rss({}, 1)
+    (0, 0)
+    """
+    children = {}
+    for pid, (ppid, _) in processes.items():
+        children.setdefault(ppid, []).append(pid)
+
+    descendants_rss = 0
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        descendants_rss += processes[pid][1]
+        stack.extend(children.get(pid, []))
+    return processes.get(root_pid, (0, 0))[1], descendants_rss
+
+
+def sample_tree_rss(root_pid: int) -> tuple[int, int]:
+    """
+    Return the current RSS in KB of the given process and the total RSS of its
+    descendants.
+    """
+    output = subprocess.run(
+        ["ps", "-A", "-o", "pid=,ppid=,rss="],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return get_tree_rss(parse_ps_output(output), root_pid)
+
+
+class MemoryTracker:
+    """
+    Samples the RSS of the BiDi server process (node runner or ChromeDriver) and
+    of its descendants, i.e. the browser processes including the mapper tab.
+
+    The server lives for the whole session, so its RSS is sampled before the
+    test setup and after the teardown. A test is flagged if it increased the
+    server RSS by more than the threshold and the RSS never went back below
+    that level in any later sample.
+
+    The browser is launched per session, so its RSS is sampled after the setup
+    and after the test call, reporting the in-session growth.
+    """
+
+    def __init__(self, server_pid: int, threshold_kb: int, report_file: str | None):
+        self.server_pid = server_pid
+        self.threshold_kb = threshold_kb
+        self.report_file = report_file
+        self.records: list[dict] = []
+        self.current: dict = {}
+
+    def _sample(self) -> tuple[int, int]:
+        return sample_tree_rss(self.server_pid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.current = {"nodeid": item.nodeid}
+        self.current["server_before_kb"], _ = self._sample()
+        yield
+        _, self.current["browser_setup_kb"] = self._sample()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield
+        _, self.current["browser_call_kb"] = self._sample()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        record = self.current
+        record["server_after_kb"], _ = self._sample()
+        record["server_delta_kb"] = (
+            record["server_after_kb"] - record["server_before_kb"]
+        )
+        if "browser_call_kb" in record:
+            record["browser_delta_kb"] = (
+                record["browser_call_kb"] - record["browser_setup_kb"]
+            )
+        self.records.append(record)
+        # Reported in the teardown report, e.g. in the JUnit XML.
+        item.user_properties.append(("server_rss_delta_kb", record["server_delta_kb"]))
+        if "browser_delta_kb" in record:
+            item.user_properties.append(
+                ("browser_rss_delta_kb", record["browser_delta_kb"])
+            )
+
+    def get_leaking_tests(self) -> list[dict]:
+        leaking = []
+        for index, record in enumerate(self.records):
+            level = record["server_before_kb"] + self.threshold_kb
+            if record["server_after_kb"] <= level:
+                continue
+            later_samples = [
+                sample
+                for later in self.records[index + 1 :]
+                for sample in (later["server_before_kb"], later["server_after_kb"])
+            ]
+            if all(sample > level for sample in later_samples):
+                leaking.append(record)
+        return leaking
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.report_file:
+            with open(self.report_file, "w") as f:
+                json.dump(
+                    {
+                        "tests": self.records,
+                        "leaking": [r["nodeid"] for r in self.get_leaking_tests()],
+                    },
+                    f,
+                    indent=2,
+                )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section("memory usage")
+        if self.records:
+            first, last = self.records[0], self.records[-1]
+            terminalreporter.write_line(
+                f"BiDi server RSS: {first['server_before_kb']} KB -> "
+                f"{last['server_after_kb']} KB"
+            )
+        for record in self.get_leaking_tests():
+            terminalreporter.write_line(
+                f"Server memory never returned to baseline after {record['nodeid']}: "
+                f"+{record['server_delta_kb']} KB"
+            )
+        largest_growth = sorted(
+            (r for r in self.records if "browser_delta_kb" in r),
+            key=lambda r: r["browser_delta_kb"],
+            reverse=True,
+        )[:10]
+        for record in largest_growth:
+            terminalreporter.write_line(
+                f"Browser RSS growth during {record['nodeid']}: "
+                f"{record['browser_delta_kb']:+} KB"
+            )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("memory tracker")
+    group.addoption(
+        "--track-memory",
+        action="store_true",
+        help="Sample the RSS of the BiDi server process, which PID is set in the "
+        "BIDI_SERVER_PID environment variable, and of the browser before and "
+        "after each test.",
+    )
+    group.addoption(
+        "--memory-leak-threshold",
+        type=int,
+        default=10,
+        help="Server RSS increase in MB to flag a test as leaking.",
+    )
+    group.addoption(
+        "--memory-report", help="JSON file to write the per-test memory usage to."
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--track-memory"):
+        return
+    server_pid = os.environ.get("BIDI_SERVER_PID")
+    if not server_pid or sys.platform == "win32":
+        # Shown in the warnings summary, as the output is captured.
+        config.issue_config_time_warning(
+            pytest.PytestConfigWarning(
+                "Memory tracking requires BIDI_SERVER_PID and `ps`. Skipping."
+            ),
+            stacklevel=2,
+        )
+        return
+    config.pluginmanager.register(
+        MemoryTracker(
+            int(server_pid),
+            config.getoption("--memory-leak-threshold") * 1024,
+            config.getoption("--memory-report"),
+        ),
+        "memory_tracker_plugin",
+    )
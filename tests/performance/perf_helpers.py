@@ -0,0 +1,244 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from test_helpers import get_next_command_id
+
+ITERATIONS = int(os.environ.get("ITERATIONS", 10))
+# Same default as in `tools/benchmark-utils.mjs`.
+WARMUP_ITERATIONS = int(
+    os.environ.get("WARMUP_ITERATIONS", max(2, int(0.1 * ITERATIONS)))
+)
+
+# Parametrizations which take minutes or gigabytes of memory, e.g. floods of
+# 100k events or 100 MB bodies, only run if `HEAVY_BENCHMARKS` is set to `true`.
+heavy = pytest.mark.skipif(
+    os.environ.get("HEAVY_BENCHMARKS") != "true",
+    reason="Set HEAVY_BENCHMARKS=true to run the heavy benchmarks.",
+)
+
+
+# Required metric fields and their types. `name`, `value`, `unit` and `extra`
+# are the fields expected by the benchmark dashboard.
+METRIC_SCHEMA = {
+    "name": str,
+    "value": (int, float),
+    "unit": str,
+    "extra": str,
+    "dimensions": dict,
+}
+DIMENSIONS = ("os", "head", "runner", "test", "metric", "stat")
+
+
+def validate_metric(metric: dict):
+    """
+    Raise `ValueError` if the metric does not match the schema.
+
+    >>> metric = {"name": "n", "value": 1.5, "unit": "ms", "extra": "e",
+    ...     "dimensions": {"os": "o", "head": "h", "runner": "r", "test": "t",
+    ...     "metric": "m", "stat": "mean"}}
+    >>> validate_metric(metric)
+    >>> validate_metric(metric | {"value": float("nan")})
+    Traceback (most recent call last):
+    ...
+    ValueError: Metric value must be finite: nan
+    >>> validate_metric(metric | {"dimensions": {}})
+    Traceback (most recent call last):
+    ...
+    ValueError: Metric dimension 'os' must be a string: None
+    """
+    for field, field_type in METRIC_SCHEMA.items():
+        if not isinstance(metric.get(field), field_type) or isinstance(
+            metric.get(field), bool
+        ):
+            raise ValueError(
+                f"Metric field '{field}' must be of type {field_type}: {metric.get(field)!r}"
+            )
+    if not math.isfinite(metric["value"]):
+        raise ValueError(f"Metric value must be finite: {metric['value']}")
+    for dimension in DIMENSIONS:
+        if not isinstance(metric["dimensions"].get(dimension), str):
+            raise ValueError(
+                f"Metric dimension '{dimension}' must be a string: {metric['dimensions'].get(dimension)!r}"
+            )
+    if "samples" in metric and not all(
+        isinstance(sample, (int, float)) for sample in metric["samples"]
+    ):
+        raise ValueError("Metric samples must be numbers")
+
+
+class MetricsSink:
+    """
+    Buffers the metrics of the session in memory. They are written to the output
+    file as a single JSON document when the session finishes, or as NDJSON if the
+    file name ends with `.ndjson` or `.jsonl`. Without an output file, metrics are
+    printed as soon as they are added.
+    """
+
+    def __init__(self, output_file: str | None):
+        self.output_file = output_file
+        self.metrics: list[dict] = []
+
+    def add(self, metric: dict):
+        validate_metric(metric)
+        if self.output_file:
+            self.metrics.append(metric)
+        else:
+            print(f"PERF_METRIC:{json.dumps(metric)}")
+
+    def flush(self):
+        if not self.output_file or not self.metrics:
+            return
+        with open(self.output_file, "w") as f:
+            if self.output_file.endswith((".ndjson", ".jsonl")):
+                for metric in self.metrics:
+                    f.write(json.dumps(metric) + "\n")
+            else:
+                json.dump(self.metrics, f, indent=2)
+
+
+# Flushed by `pytest_sessionfinish` in `conftest.py`.
+metrics_sink = MetricsSink(os.environ.get("METRICS_JSON_FILE"))
+
+
+def log_metric(
+    test_name,
+    name,
+    value,
+    unit="ms",
+    samples: list[float] | None = None,
+    stat="value",
+):
+    """
+    Logs the metric. The statistic, e.g. `median`, is the aggregation of the
+    samples the value was computed from, and is appended to the name. The
+    optional raw samples allow `tools/perf_metrics.py compare` to estimate the
+    confidence intervals.
+    """
+    os_name = os.environ.get("OS", "unknownOs")
+    head = os.environ.get("HEAD", "unknownHead")
+    runner = os.environ.get("RUNNER", "unknownRunner")
+    parts = [name] if stat == "value" else [name, stat]
+    suffix = "".join(f"_{part}" for part in parts if part)
+    metric = {
+        # Keep the concatenated name, as the dashboard identifies series by it.
+        "name": f"{os_name}-{head}-{runner}:{test_name}{suffix}",
+        "value": value,
+        "unit": unit,
+        "extra": f"{os_name}-{head}:e2e-perf-metric",
+        "dimensions": {
+            "os": os_name,
+            "head": head,
+            "runner": runner,
+            "test": test_name,
+            # Empty for the samples of the test itself.
+            "metric": name,
+            "stat": stat,
+        },
+    }
+    if samples is not None:
+        metric["samples"] = samples
+    metrics_sink.add(metric)
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """
+    Return the given percentile (0 to 1) of the samples, picked by rank the same
+    way as in `tools/benchmark-utils.mjs`.
+
+    >>> percentile([5, 1, 4, 2, 3], 0.5)
+    3
+    >>> percentile(list(range(10)), 0.1)
+    1
+    >>> percentile(list(range(10)), 0.9)
+    9
+    """
+    return sorted(samples)[int(len(samples) * p)]
+
+
+def log_samples(test_name, samples: list[float], name_prefix="", attach_samples=True):
+    """
+    Logs the mean, median, p10 and p90 of the given samples in seconds as
+    metrics in milliseconds. Attaching the raw samples can be disabled for large
+    sample sets.
+    """
+    samples_ms = [sample * 1000 for sample in samples]
+    for name, value in [
+        ("mean", statistics.mean(samples_ms)),
+        ("median", statistics.median(samples_ms)),
+        ("p10", percentile(samples_ms, 0.1)),
+        ("p90", percentile(samples_ms, 0.9)),
+    ]:
+        log_metric(
+            test_name,
+            name_prefix.removesuffix("_"),
+            value,
+            samples=samples_ms if attach_samples else None,
+            stat=name,
+        )
+
+
+async def measure(
+    action: Callable[[], Awaitable[Any]],
+    cleanup: Callable[[Any], Awaitable[Any]] | None = None,
+    iterations=ITERATIONS,
+    warmup_iterations=WARMUP_ITERATIONS,
+) -> list[float]:
+    """
+    Runs the given action `warmup_iterations` times without measuring, then
+    returns the duration in seconds of each of the next `iterations` runs. The
+    optional cleanup is called with the action result outside the measurement.
+    """
+    samples = []
+    for i in range(warmup_iterations + iterations):
+        start_time = time.perf_counter()
+        result = await action()
+        duration = time.perf_counter() - start_time
+        if i >= warmup_iterations:
+            samples.append(duration)
+        if cleanup is not None:
+            await cleanup(result)
+    return samples
+
+
+async def execute_commands_concurrently(websocket, commands: list[dict]) -> list[float]:
+    """
+    Sends all the given commands at once over the websocket, and returns the
+    latency in seconds of each of them. Events are ignored.
+    """
+    send_times = {}
+    for command in commands:
+        command["id"] = get_next_command_id()
+        send_times[command["id"]] = time.perf_counter()
+        await websocket.send(json.dumps(command))
+
+    latencies = []
+    while len(latencies) < len(commands):
+        # Read the messages directly, as `read_JSON_message` logs every message.
+        message = json.loads(await websocket.recv())
+        if message.get("id") not in send_times:
+            continue
+        if message.get("type") != "success":
+            raise Exception({"error": message["error"], "message": message["message"]})
+        latencies.append(time.perf_counter() - send_times.pop(message["id"]))
+    return latencies
@@ -0,0 +1,86 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+from perf_helpers import log_metric, log_samples
+from test_helpers import goto_url, send_JSON_command, subscribe
+
+# Sizes of the string sent with each message.
+PAYLOAD_SIZES = {"small": 10, "large": 10 * 1024}
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("channels", [1, 4])
+@pytest.mark.parametrize("payload", PAYLOAD_SIZES.keys())
+@pytest.mark.parametrize("count", [1_000, 10_000])
+async def test_performance_channel_messages(
+    websocket, context_id, html, current_test_name, count, payload, channels
+):
+    """Measures the delivery of `script.message` events, sent by the page as
+    fast as possible through the given number of channels."""
+    await goto_url(websocket, context_id, html("<h1>Benchmark</h1>"))
+    await subscribe(websocket, ["script.message"])
+
+    start_time = time.perf_counter()
+    await send_JSON_command(
+        websocket,
+        {
+            "method": "script.callFunction",
+            "params": {
+                "functionDeclaration": f"""(...channels) => {{
+                    const payload = 'x'.repeat({PAYLOAD_SIZES[payload]});
+                    for (let i = 0; i < {count}; i++) {{
+                        channels[i % channels.length]([Date.now(), payload]);
+                    }}
+                }}""",
+                "arguments": [
+                    {
+                        "type": "channel",
+                        "value": {
+                            "channel": f"benchmark-channel-{i}",
+                            # Serialize the array items.
+                            "serializationOptions": {"maxObjectDepth": 1},
+                        },
+                    }
+                    for i in range(channels)
+                ],
+                "target": {"context": context_id},
+                "awaitPromise": False,
+            },
+        },
+    )
+
+    # Read the messages directly, as `read_JSON_message` logs every message.
+    latencies = []
+    while len(latencies) < count:
+        message = json.loads(await websocket.recv())
+        if message.get("method") != "script.message":
+            continue
+        # The first item is the wall time at which the message was sent.
+        sent_time = message["params"]["data"]["value"][0]["value"]
+        latencies.append(time.time() - sent_time / 1000)
+    duration = time.perf_counter() - start_time
+
+    log_metric(
+        current_test_name, "time_per_message", duration * 1000 / count, "ms/message"
+    )
+    log_samples(
+        current_test_name, latencies, name_prefix="latency_", attach_samples=False
+    )
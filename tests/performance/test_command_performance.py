@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from perf_helpers import log_samples, measure
+from test_helpers import execute_command, goto_url
+
+# Factories of the measured commands. Each call returns a new command, as
+# `execute_command` assigns an id to it.
+COMMANDS = {
+    "script.evaluate": lambda context_id, url: {
+        "method": "script.evaluate",
+        "params": {
+            "expression": "({a: 1, b: [1, 2, 3], c: 'some string'})",
+            "target": {"context": context_id},
+            "awaitPromise": False,
+        },
+    },
+    "script.callFunction": lambda context_id, url: {
+        "method": "script.callFunction",
+        "params": {
+            "functionDeclaration": "(a, b) => a + b",
+            "arguments": [
+                {"type": "number", "value": 1},
+                {"type": "number", "value": 2},
+            ],
+            "target": {"context": context_id},
+            "awaitPromise": False,
+        },
+    },
+    "browsingContext.navigate": lambda context_id, url: {
+        "method": "browsingContext.navigate",
+        "params": {"url": url, "context": context_id, "wait": "complete"},
+    },
+    "browsingContext.getTree": lambda context_id, url: {
+        "method": "browsingContext.getTree",
+        "params": {},
+    },
+    "browsingContext.setViewport": lambda context_id, url: {
+        "method": "browsingContext.setViewport",
+        "params": {
+            "context": context_id,
+            "viewport": {"width": 800, "height": 600},
+        },
+    },
+    "input.performActions": lambda context_id, url: {
+        "method": "input.performActions",
+        "params": {
+            "context": context_id,
+            "actions": [
+                {
+                    "type": "pointer",
+                    "id": "main_mouse",
+                    "actions": [
+                        {"type": "pointerMove", "x": 10, "y": 10},
+                        {"type": "pointerDown", "button": 0},
+                        {"type": "pointerUp", "button": 0},
+                    ],
+                }
+            ],
+        },
+    },
+    "storage.getCookies": lambda context_id, url: {
+        "method": "storage.getCookies",
+        "params": {},
+    },
+    "network.addIntercept": lambda context_id, url: {
+        "method": "network.addIntercept",
+        "params": {
+            "phases": ["beforeRequestSent"],
+            "urlPatterns": [{"type": "string", "pattern": "https://example.com/*"}],
+        },
+    },
+}
+
+# Commands reverting the state changed by the measured command, e.g. to prevent
+# intercepts from accumulating. Not measured.
+CLEANUP_COMMANDS = {
+    "network.addIntercept": lambda result: {
+        "method": "network.removeIntercept",
+        "params": {"intercept": result["intercept"]},
+    },
+}
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", COMMANDS.keys())
+async def test_performance_command(
+    websocket, context_id, html, current_test_name, method
+):
+    url = html("<h1>Benchmark</h1>")
+    await goto_url(websocket, context_id, url)
+
+    async def run_command():
+        return await execute_command(websocket, COMMANDS[method](context_id, url))
+
+    async def cleanup(result):
+        await execute_command(websocket, CLEANUP_COMMANDS[method](result))
+
+    samples = await measure(
+        run_command, cleanup if method in CLEANUP_COMMANDS else None
+    )
+
+    log_samples(current_test_name, samples)
@@ -0,0 +1,81 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import statistics
+import time
+
+import pytest
+from perf_helpers import (
+    ITERATIONS,
+    WARMUP_ITERATIONS,
+    execute_commands_concurrently,
+    heavy,
+    log_metric,
+    log_samples,
+    percentile,
+)
+from test_helpers import goto_url
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tabs", [1, 4, 16, pytest.param(64, marks=heavy)])
+async def test_performance_concurrent_evaluate(
+    websocket, context_id, create_context, html, current_test_name, tabs
+):
+    """Measures `script.evaluate` sent to all the tabs at once over a single
+    connection."""
+    context_ids = [context_id] + [await create_context() for _ in range(tabs - 1)]
+    for tab_id in context_ids:
+        await goto_url(websocket, tab_id, html("<h1>Benchmark</h1>"))
+
+    latencies = []
+    times_per_command = []
+    for i in range(WARMUP_ITERATIONS + ITERATIONS):
+        start_time = time.perf_counter()
+        round_latencies = await execute_commands_concurrently(
+            websocket,
+            [
+                {
+                    "method": "script.evaluate",
+                    "params": {
+                        "expression": "({a: 1, b: [1, 2, 3], c: 'some string'})",
+                        "target": {"context": tab_id},
+                        "awaitPromise": False,
+                    },
+                }
+                for tab_id in context_ids
+            ],
+        )
+        duration = time.perf_counter() - start_time
+        if i >= WARMUP_ITERATIONS:
+            latencies.extend(round_latencies)
+            times_per_command.append(duration * 1000 / tabs)
+
+    log_metric(
+        current_test_name,
+        "time_per_command",
+        statistics.median(times_per_command),
+        "ms/command",
+        samples=times_per_command,
+    )
+    log_samples(current_test_name, latencies, name_prefix="latency_")
+    # Tail latency.
+    log_metric(
+        current_test_name,
+        "latency_p99",
+        percentile(latencies, 0.99) * 1000,
+    )
@@ -0,0 +1,218 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import statistics
+
+import pytest
+from memory_tracker import sample_tree_rss
+from perf_helpers import heavy, log_metric, log_samples, measure
+from test_helpers import execute_command, goto_url, send_JSON_command, subscribe
+
+KB = 1024
+MB = 1024 * KB
+MAX_TOTAL_COLLECTED_SIZE = 200_000_000  # Default CDP limit.
+
+
+@pytest.fixture
+def websocket_options():
+    # The `network.getData` responses are larger than the default `max_size`.
+    return {"max_size": None}
+
+
+@pytest.fixture
+def get_url(local_server_http):
+    def get_url(size):
+        return local_server_http.url_200(
+            "x" * size,
+            content_type="application/octet-stream",
+            # Disable the cache, so that the responses are fetched each time.
+            headers={"Access-Control-Allow-Origin": "*", "Cache-Control": "no-store"},
+        )
+
+    return get_url
+
+
+async def fetch_all(websocket, context_id, urls: list[str]) -> list[str]:
+    """Fetches the given URLs concurrently from the page and returns the ids of
+    the completed requests. Requires a `network.responseCompleted`
+    subscription."""
+    command_id = await send_JSON_command(
+        websocket,
+        {
+            "method": "script.callFunction",
+            "params": {
+                "functionDeclaration": """(...urls) => Promise.all(urls.map(
+                    async (url) => (await (await fetch(url)).arrayBuffer()).byteLength))""",
+                "arguments": [{"type": "string", "value": url} for url in urls],
+                "target": {"context": context_id},
+                "awaitPromise": True,
+                "resultOwnership": "none",
+            },
+        },
+    )
+    request_ids = []
+    command_done = False
+    # Read the messages directly, as `read_JSON_message` logs every message.
+    while not command_done or len(request_ids) < len(urls):
+        message = json.loads(await websocket.recv())
+        if message.get("id") == command_id:
+            if message.get("type") != "success":
+                raise Exception(
+                    {"error": message["error"], "message": message["message"]}
+                )
+            command_done = True
+        elif message.get("method") == "network.responseCompleted":
+            request_ids.append(message["params"]["request"]["request"])
+    return request_ids
+
+
+async def add_data_collector(websocket, max_encoded_data_size):
+    await execute_command(
+        websocket,
+        {
+            "method": "network.addDataCollector",
+            "params": {
+                "dataTypes": ["response"],
+                "maxEncodedDataSize": max_encoded_data_size,
+            },
+        },
+    )
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "size, requests",
+    [
+        pytest.param(KB, 1, id="1KB-1"),
+        pytest.param(KB, 100, id="1KB-100"),
+        pytest.param(MB, 1, id="1MB-1"),
+        pytest.param(MB, 20, id="1MB-20"),
+        pytest.param(100 * MB, 1, id="100MB-1", marks=heavy),
+    ],
+)
+async def test_performance_data_collector(
+    websocket, context_id, html, get_url, current_test_name, size, requests
+):
+    """Measures the overhead of collecting the response bodies of concurrent
+    requests, and the `network.getData` latency."""
+    await goto_url(websocket, context_id, html())
+    # Subscribe in both modes, so that only the collection differs.
+    await subscribe(websocket, ["network.responseCompleted"], [context_id])
+    urls = [get_url(size) for _ in range(requests)]
+
+    without_collector = await measure(lambda: fetch_all(websocket, context_id, urls))
+
+    await add_data_collector(websocket, MAX_TOTAL_COLLECTED_SIZE)
+    request_ids = []
+
+    async def fetch_collected():
+        request_ids[:] = await fetch_all(websocket, context_id, urls)
+
+    with_collector = await measure(fetch_collected)
+
+    async def get_data():
+        await execute_command(
+            websocket,
+            {
+                "method": "network.getData",
+                "params": {"dataType": "response", "request": request_ids[0]},
+            },
+            timeout=120,
+        )
+
+    log_samples(current_test_name, without_collector, name_prefix="fetch_")
+    log_samples(current_test_name, with_collector, name_prefix="fetch_collected_")
+    log_metric(
+        current_test_name,
+        "collection_overhead_per_response",
+        (statistics.median(with_collector) - statistics.median(without_collector))
+        * 1000
+        / requests,
+    )
+    log_samples(current_test_name, await measure(get_data), name_prefix="get_data_")
+
+
+# Sizes of the fetched responses, cycled through.
+RESPONSE_SIZES = [100 * KB, MB, 5 * MB]
+RESPONSES = 60
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "max_encoded_data_size",
+    [
+        pytest.param(MB, id="1MB"),
+        pytest.param(10 * MB, id="10MB"),
+        pytest.param(100 * MB, id="100MB", marks=heavy),
+    ],
+)
+async def test_performance_data_collector_memory(
+    websocket, context_id, html, get_url, current_test_name, max_encoded_data_size
+):
+    """Fetches many responses of different sizes with a data collector, and
+    reports how many of them are still available and the memory growth of the
+    BiDi server and the browser, which hosts the mapper tab. The memory is only
+    reported if the BiDi server PID is set in `BIDI_SERVER_PID`."""
+    server_pid = os.environ.get("BIDI_SERVER_PID")
+    await goto_url(websocket, context_id, html())
+    await subscribe(websocket, ["network.responseCompleted"], [context_id])
+    await add_data_collector(websocket, max_encoded_data_size)
+    urls = [get_url(RESPONSE_SIZES[i % len(RESPONSE_SIZES)]) for i in range(RESPONSES)]
+
+    if server_pid:
+        server_before, browser_before = sample_tree_rss(int(server_pid))
+    # Fetch in small batches, as a page would load its resources.
+    request_ids = []
+    for i in range(0, RESPONSES, len(RESPONSE_SIZES)):
+        request_ids += await fetch_all(
+            websocket, context_id, urls[i : i + len(RESPONSE_SIZES)]
+        )
+    if server_pid:
+        server_after, browser_after = sample_tree_rss(int(server_pid))
+        log_metric(
+            current_test_name,
+            "server_rss_delta",
+            (server_after - server_before) / KB,
+            "MB",
+        )
+        log_metric(
+            current_test_name,
+            "browser_rss_delta",
+            (browser_after - browser_before) / KB,
+            "MB",
+        )
+
+    collected = 0
+    for request_id in request_ids:
+        try:
+            await execute_command(
+                websocket,
+                {
+                    "method": "network.getData",
+                    "params": {"dataType": "response", "request": request_id},
+                },
+                timeout=120,
+            )
+            collected += 1
+        except Exception as e:
+            if "no such network data" not in str(e):
+                raise
+    log_metric(current_test_name, "collected_responses", collected, "responses")
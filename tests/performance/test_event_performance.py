@@ -0,0 +1,73 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+from perf_helpers import heavy, log_metric, log_samples
+from test_helpers import goto_url, send_JSON_command, subscribe
+
+# Arguments of the emitted `console.log` calls, from cheap to expensive to
+# serialize. `i` is the index of the call.
+CONSOLE_ARGUMENTS = {
+    "primitive": "i",
+    "object": "{i, text: 'some text', nested: {list: [1, 2, 3], flag: true}}",
+    "many_arguments": "i, 'some text', 2.5, null, [1, 2, 3], {a: {b: {c: 1}}}",
+}
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("goog_channel", [None, "benchmark-channel"])
+@pytest.mark.parametrize("arguments", CONSOLE_ARGUMENTS.keys())
+@pytest.mark.parametrize("count", [1_000, 10_000, pytest.param(100_000, marks=heavy)])
+async def test_performance_log_entry_added_flood(
+    websocket, context_id, html, current_test_name, count, arguments, goog_channel
+):
+    """Measures the delivery of `log.entryAdded` events, emitted by the page as
+    fast as possible."""
+    await goto_url(websocket, context_id, html("<h1>Benchmark</h1>"))
+    await subscribe(websocket, ["log.entryAdded"], goog_channel=goog_channel)
+
+    start_time = time.perf_counter()
+    await send_JSON_command(
+        websocket,
+        {
+            "method": "script.evaluate",
+            "params": {
+                "expression": f"""for (let i = 0; i < {count}; i++) {{
+                    console.log({CONSOLE_ARGUMENTS[arguments]});
+                }}""",
+                "target": {"context": context_id},
+                "awaitPromise": False,
+            },
+        },
+    )
+
+    # Read the messages directly, as `read_JSON_message` logs every message.
+    lags = []
+    while len(lags) < count:
+        message = json.loads(await websocket.recv())
+        if message.get("method") != "log.entryAdded":
+            continue
+        # The log entry timestamp is the wall time of the `console.log` call.
+        lags.append(time.time() - message["params"]["timestamp"] / 1000)
+    duration = time.perf_counter() - start_time
+
+    # Time rather than throughput, as the dashboard series are smaller-is-better.
+    log_metric(current_test_name, "time_per_event", duration * 1000 / count, "ms/event")
+    log_samples(current_test_name, lags, name_prefix="lag_", attach_samples=False)
@@ -0,0 +1,162 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import statistics
+
+import pytest
+from perf_helpers import WARMUP_ITERATIONS, log_metric, log_samples, measure
+from test_helpers import execute_command, goto_url
+
+# Number of actions in each sequence.
+ACTION_COUNT = 1_000
+
+# Counts the input events received by the page and the time span between the
+# first and the last one.
+PAGE = """
+<textarea id="input"></textarea>
+<div style="height: 20000px; width: 10px"></div>
+<script>
+    var stats = {count: 0, first: 0, last: 0};
+    for (const name of ["mousemove", "keydown", "keyup", "input", "wheel"]) {
+        window.addEventListener(name, () => {
+            const now = performance.now();
+            if (stats.count === 0) {
+                stats.first = now;
+            }
+            stats.last = now;
+            stats.count++;
+        });
+    }
+    document.getElementById("input").focus();
+</script>
+"""
+
+# Mixes ASCII characters, accented letters and multi-code point graphemes.
+GRAPHEMES = [
+    "a",
+    "Z",
+    "1",
+    " ",
+    "\u00e9",
+    "e\u0301",
+    "\u20ac",
+    "\U0001f44d",
+    "\U0001f44d\U0001f3fd",
+    "\U0001f1e9\U0001f1ea",
+]
+
+ACTION_SEQUENCES = {
+    "pointer_moves": lambda: {
+        "type": "pointer",
+        "id": "main_mouse",
+        "actions": [
+            {"type": "pointerMove", "x": 10 + i % 200, "y": 100 + i % 2}
+            for i in range(ACTION_COUNT)
+        ],
+    },
+    "keys": lambda: {
+        "type": "key",
+        "id": "main_keyboard",
+        "actions": [
+            {"type": key_type, "value": GRAPHEMES[i % len(GRAPHEMES)]}
+            for i in range(ACTION_COUNT // 2)
+            for key_type in ("keyDown", "keyUp")
+        ],
+    },
+    "wheel_scrolls": lambda: {
+        "type": "wheel",
+        "id": "main_wheel",
+        "actions": [
+            {"type": "scroll", "x": 10, "y": 10, "deltaX": 0, "deltaY": 5}
+            for _ in range(ACTION_COUNT)
+        ],
+    },
+}
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sequence", ACTION_SEQUENCES.keys())
+async def test_performance_input_actions(
+    websocket, context_id, html, current_test_name, sequence
+):
+    """Measures `input.performActions` with a long action sequence, end to end
+    and from the page's perspective."""
+    await goto_url(websocket, context_id, html(PAGE))
+
+    page_intervals = []
+
+    async def perform_actions():
+        await execute_command(
+            websocket,
+            {
+                "method": "input.performActions",
+                "params": {
+                    "context": context_id,
+                    "actions": [ACTION_SEQUENCES[sequence]()],
+                },
+            },
+        )
+
+    async def collect_page_stats(_):
+        await execute_command(
+            websocket,
+            {"method": "input.releaseActions", "params": {"context": context_id}},
+        )
+        result = await execute_command(
+            websocket,
+            {
+                "method": "script.evaluate",
+                "params": {
+                    "expression": """(() => {
+                        const result = [stats.count, stats.last - stats.first];
+                        stats = {count: 0, first: 0, last: 0};
+                        return result;
+                    })()""",
+                    "target": {"context": context_id},
+                    "awaitPromise": False,
+                },
+            },
+        )
+        count, span_ms = (item["value"] for item in result["result"]["value"])
+        page_intervals.append(
+            span_ms / (count - 1) if count > 1 and span_ms > 0 else None
+        )
+
+    samples = await measure(perform_actions, collect_page_stats)
+    # `measure` also runs the cleanup after the warmup iterations, skip them.
+    page_intervals = [
+        interval
+        for interval in page_intervals[WARMUP_ITERATIONS:]
+        if interval is not None
+    ]
+
+    log_samples(current_test_name, samples)
+    log_metric(
+        current_test_name,
+        "time_per_action",
+        sum(samples) * 1000 / (ACTION_COUNT * len(samples)),
+        "ms/action",
+    )
+    if page_intervals:
+        # Median over the iterations of the mean interval between the input
+        # events received by the page.
+        log_metric(
+            current_test_name,
+            "page_event_interval",
+            statistics.median(page_intervals),
+            "ms/event",
+        )
@@ -0,0 +1,166 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import statistics
+from urllib.parse import urlparse
+
+import pytest
+from perf_helpers import log_metric, log_samples, measure
+from test_helpers import execute_command, send_JSON_command, subscribe
+
+# Number of intercepts and URL patterns per intercept not matching the page in
+# the "many_patterns" mode.
+NON_MATCHING_INTERCEPTS = 10
+NON_MATCHING_PATTERNS = 10
+
+
+async def load_page(websocket, context_id, url) -> int:
+    """Navigates to the URL and waits for the load, continuing all the blocked
+    requests as soon as their `network.beforeRequestSent` event arrives.
+    Returns the number of blocked requests."""
+    blocked = 0
+    command_id = await send_JSON_command(
+        websocket,
+        {
+            "method": "browsingContext.navigate",
+            "params": {"url": url, "context": context_id, "wait": "complete"},
+        },
+    )
+    while True:
+        # Read the messages directly, as `read_JSON_message` logs every message.
+        message = json.loads(await websocket.recv())
+        if message.get("id") == command_id:
+            if message.get("type") != "success":
+                raise Exception(
+                    {"error": message["error"], "message": message["message"]}
+                )
+            return blocked
+        if (
+            message.get("method") == "network.beforeRequestSent"
+            and message["params"]["isBlocked"]
+        ):
+            blocked += 1
+            # Do not wait for the result, it is ignored by this loop.
+            await send_JSON_command(
+                websocket,
+                {
+                    "method": "network.continueRequest",
+                    "params": {"request": message["params"]["request"]["request"]},
+                },
+            )
+
+
+async def add_intercept(websocket, url_patterns=None):
+    params = {"phases": ["beforeRequestSent"]}
+    if url_patterns is not None:
+        params["urlPatterns"] = url_patterns
+    result = await execute_command(
+        websocket, {"method": "network.addIntercept", "params": params}
+    )
+    return result["intercept"]
+
+
+def get_page_pattern(local_server_http) -> dict:
+    """Return a URL pattern matching the requests to the local server."""
+    origin = urlparse(local_server_http.origin())
+    return {
+        "type": "pattern",
+        "protocol": origin.scheme,
+        "hostname": origin.hostname,
+        "port": str(origin.port),
+    }
+
+
+def get_page_url(local_server_http, subresources) -> str:
+    no_store = {"Cache-Control": "no-store"}
+    return local_server_http.url_200(
+        "".join(
+            f"<link rel='stylesheet' href='{local_server_http.url_200(f'/* {i} */', content_type='text/css', headers=no_store)}'>"
+            for i in range(subresources)
+        ),
+        headers=no_store,
+    )
+
+
+@pytest.mark.asyncio
+async def test_performance_network_interception_pattern_matches(
+    websocket, context_id, local_server_http
+):
+    """The intercept of the "many_patterns" mode blocks the document and all its
+    subresources."""
+    await subscribe(websocket, ["network.beforeRequestSent"])
+    await add_intercept(websocket, [get_page_pattern(local_server_http)])
+
+    assert (
+        await load_page(websocket, context_id, get_page_url(local_server_http, 3))
+        >= 3 + 1
+    )
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("subresources", [10, 50])
+async def test_performance_network_interception(
+    websocket, context_id, local_server_http, current_test_name, subresources
+):
+    """Measures the page load with the given number of subresources without
+    intercepts, with an intercept continuing all the requests, and with many
+    intercepts and URL patterns to match."""
+    page_url = get_page_url(local_server_http, subresources)
+
+    # Subscribe in all the modes, so that only the interception differs.
+    await subscribe(websocket, ["network.beforeRequestSent"])
+
+    samples = {}
+    samples["no_intercept"] = await measure(
+        lambda: load_page(websocket, context_id, page_url)
+    )
+
+    intercept = await add_intercept(websocket)
+    samples["intercept"] = await measure(
+        lambda: load_page(websocket, context_id, page_url)
+    )
+    await execute_command(
+        websocket,
+        {"method": "network.removeIntercept", "params": {"intercept": intercept}},
+    )
+
+    for i in range(NON_MATCHING_INTERCEPTS):
+        await add_intercept(
+            websocket,
+            [
+                {"type": "pattern", "hostname": f"host-{i}-{j}.test"}
+                for j in range(NON_MATCHING_PATTERNS)
+            ],
+        )
+    await add_intercept(websocket, [get_page_pattern(local_server_http)])
+    samples["many_patterns"] = await measure(
+        lambda: load_page(websocket, context_id, page_url)
+    )
+
+    baseline = statistics.median(samples["no_intercept"])
+    for mode, mode_samples in samples.items():
+        log_samples(current_test_name, mode_samples, name_prefix=f"{mode}_")
+        if mode != "no_intercept":
+            # The document and its subresources are intercepted.
+            log_metric(
+                current_test_name,
+                f"{mode}_added_latency_per_request",
+                (statistics.median(mode_samples) - baseline)
+                * 1000
+                / (subresources + 1),
+            )
@@ -13,34 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import base64
 import os
-import statistics
-import time
+import tracemalloc
 from pathlib import Path
 
 import pytest
-from test_helpers import execute_command, goto_url
-
-ITERATIONS = int(os.environ.get("ITERATIONS", 10))
-
-
-def log_metric(test_name, name, value, unit="ms"):
-    os_name = os.environ.get("OS", "unknownOs")
-    head = os.environ.get("HEAD", "unknownHead")
-    runner = os.environ.get("RUNNER", "unknownRunner")
-    metrics_json_file = os.environ.get("METRICS_JSON_FILE")
-    metric = {
-        "name": f"{os_name}-{head}-{runner}:{test_name}_{name}",
-        "value": value,
-        "unit": unit,
-        "extra": f"{os_name}-{head}:e2e-perf-metric",
-    }
-    if metrics_json_file:
-        with open(metrics_json_file, "a") as f:
-            f.write(json.dumps(metric) + ",\n")
-    else:
-        print(f"PERF_METRIC:{json.dumps(metric)}")
+from perf_helpers import log_metric, log_samples, measure
+from test_helpers import execute_command, goto_url, save_pdf
 
 
 async def capture_screenshot(websocket, context_id):
@@ -80,19 +60,30 @@ async def test_performance_screenshot(websocket, context_id, current_test_name):
         f"file://{Path(__file__).parent.resolve()}/resources/long_page.html",
     )
 
-    # Pre-warm.
-    await capture_screenshot(websocket, context_id)
+    samples = await measure(lambda: capture_screenshot(websocket, context_id))
+
+    log_samples(current_test_name, samples)
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+async def test_performance_save_pdf(tmp_path, current_test_name):
+    """Measures decoding and saving of a large base64 payload, e.g. a
+    `browsingContext.print` result of a long document."""
+    payload_size = 50 * 1024 * 1024
+    pdf_base64 = base64.b64encode(b"%PDF" + os.urandom(payload_size - 4)).decode()
+    output_file = str(tmp_path / "out.pdf")
+
+    async def save():
+        save_pdf(pdf_base64, output_file)
 
-    samples = []
-    for i in range(ITERATIONS):
-        start_time = time.perf_counter()
-        await capture_screenshot(websocket, context_id)
-        samples.append(time.perf_counter() - start_time)
+    samples = await measure(save)
 
-    mean_value = statistics.mean(samples) * 1000
-    median_value = statistics.median(samples) * 1000
-    p10_value = sorted(samples)[int(len(samples) * 0.1)] * 1000
+    tracemalloc.start()
+    save_pdf(pdf_base64, output_file)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
 
-    log_metric(current_test_name, "mean", mean_value)
-    log_metric(current_test_name, "median", median_value)
-    log_metric(current_test_name, "p10", p10_value)
+    log_samples(current_test_name, samples)
+    log_metric(current_test_name, "peak_memory", peak_memory / 1024 / 1024, "MB")
@@ -0,0 +1,85 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from perf_helpers import log_samples, measure
+from test_helpers import execute_command, goto_url
+
+# Parameters of the preload scripts, added to the `functionDeclaration`.
+VARIANTS = {
+    "plain": {},
+    "sandbox": {"sandbox": "benchmark-sandbox"},
+    "channel": {
+        "arguments": [{"type": "channel", "value": {"channel": "benchmark-channel"}}]
+    },
+}
+
+# Without preload scripts, the variant makes no difference.
+CASES = [pytest.param(0, "plain", id="0-plain")] + [
+    pytest.param(count, variant, id=f"{count}-{variant}")
+    for count in [1, 10, 50]
+    for variant in VARIANTS
+]
+
+
+def get_preload_script(index: int, variant: str) -> dict:
+    if variant == "channel":
+        function_declaration = f"(channel) => {{ channel({index}); }}"
+    else:
+        function_declaration = f"() => {{ window.preloaded_{index} = true; }}"
+    return {
+        "method": "script.addPreloadScript",
+        "params": {"functionDeclaration": function_declaration, **VARIANTS[variant]},
+    }
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count, variant", CASES)
+async def test_performance_preload_scripts(
+    websocket, context_id, html, current_test_name, count, variant
+):
+    """Measures the navigation and the new tab creation with the given number
+    of global preload scripts, which run in every new document and target."""
+    for i in range(count):
+        await execute_command(websocket, get_preload_script(i, variant))
+
+    url = html("<h1>Benchmark</h1>")
+
+    async def navigate():
+        await goto_url(websocket, context_id, url)
+
+    async def create_tab():
+        return await execute_command(
+            websocket,
+            {"method": "browsingContext.create", "params": {"type": "tab"}},
+        )
+
+    async def close_tab(result):
+        await execute_command(
+            websocket,
+            {
+                "method": "browsingContext.close",
+                "params": {"context": result["context"]},
+            },
+        )
+
+    log_samples(current_test_name, await measure(navigate), name_prefix="navigate_")
+    log_samples(
+        current_test_name,
+        await measure(create_tab, close_tab),
+        name_prefix="create_tab_",
+    )
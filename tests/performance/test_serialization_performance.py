@@ -0,0 +1,103 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+from perf_helpers import ITERATIONS, WARMUP_ITERATIONS, log_metric, log_samples
+from test_helpers import goto_url, send_JSON_command
+
+NODES = 1_000
+
+# Page with `NODES` elements, each with a child and an open shadow root.
+PAGE = (
+    "".join(f"<div><span>{i}</span></div>" for i in range(NODES))
+    + """<script>
+        for (const div of document.querySelectorAll('div')) {
+          div.attachShadow({mode: 'open'}).innerHTML = '<p>shadow</p>';
+        }
+    </script>"""
+)
+
+# Serialized values.
+VALUES = {
+    "array": "Array.from({length: 10000}, (_, i) => i)",
+    "deep_object": """(() => {
+        let result = {};
+        for (let i = 0; i < 100; i++) {
+          result = {i, text: 'some text', next: result};
+        }
+        return result;
+    })()""",
+    "map_set": """new Map(Array.from(
+        {length: 1000}, (_, i) => [`key${i}`, new Set([i, `value${i}`])]))""",
+    "node_list": "document.querySelectorAll('div')",
+}
+
+SERIALIZATION_OPTIONS = {
+    "default": {},
+    "max_object_depth_1": {"maxObjectDepth": 1},
+    "max_dom_depth_2": {"maxDomDepth": 2},
+    "max_dom_depth_2_open_shadow": {"maxDomDepth": 2, "includeShadowTree": "open"},
+}
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", SERIALIZATION_OPTIONS.keys())
+@pytest.mark.parametrize("value", VALUES.keys())
+async def test_performance_serialization(
+    websocket, context_id, html, current_test_name, value, options
+):
+    """Measures separately the round trip of `script.evaluate` returning a large
+    value, which includes the serialization in the mapper, and the decoding of
+    the response by the client."""
+    await goto_url(websocket, context_id, html(PAGE))
+
+    round_trips = []
+    decodes = []
+    for i in range(WARMUP_ITERATIONS + ITERATIONS):
+        start_time = time.perf_counter()
+        command_id = await send_JSON_command(
+            websocket,
+            {
+                "method": "script.evaluate",
+                "params": {
+                    "expression": VALUES[value],
+                    "target": {"context": context_id},
+                    "awaitPromise": False,
+                    "serializationOptions": SERIALIZATION_OPTIONS[options],
+                },
+            },
+        )
+        # No events are subscribed to, so the next message is the response.
+        raw_message = await websocket.recv()
+        round_trip = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        message = json.loads(raw_message)
+        decode = time.perf_counter() - start_time
+
+        if message.get("id") != command_id or message.get("type") != "success":
+            raise Exception(f"Unexpected message: {raw_message[:1000]}")
+        if i >= WARMUP_ITERATIONS:
+            round_trips.append(round_trip)
+            decodes.append(decode)
+
+    log_samples(current_test_name, round_trips, name_prefix="round_trip_")
+    log_samples(current_test_name, decodes, name_prefix="decode_")
+    log_metric(current_test_name, "response_size", len(raw_message) / 1024, "KB")
@@ -0,0 +1,72 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+import websockets
+from perf_helpers import ITERATIONS, WARMUP_ITERATIONS, log_samples
+from test_helpers import connect_websocket, execute_command, get_tree
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+async def test_performance_session_lifecycle(session_capabilities, current_test_name):
+    """Measures separately the phases of the session lifecycle: websocket
+    connection, `session.new`, first `browsingContext.getTree` and
+    `session.end`. The browser is launched in the headless mode
+    selected by `test_headless_mode`."""
+    phases = {"connect": [], "session_new": [], "get_tree": [], "session_end": []}
+
+    for i in range(WARMUP_ITERATIONS + ITERATIONS):
+        durations = {}
+
+        start_time = time.perf_counter()
+        connection = await connect_websocket()
+        durations["connect"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        await execute_command(
+            connection,
+            {
+                "method": "session.new",
+                "params": {"capabilities": {"alwaysMatch": session_capabilities}},
+            },
+            timeout=40,
+        )
+        durations["session_new"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        await get_tree(connection)
+        durations["get_tree"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        try:
+            await execute_command(connection, {"method": "session.end", "params": {}})
+        except websockets.exceptions.ConnectionClosed:
+            # The runner can close the connection before sending the
+            # `session.end` response. The session is ended either way.
+            pass
+        durations["session_end"] = time.perf_counter() - start_time
+
+        await connection.close()
+
+        if i >= WARMUP_ITERATIONS:
+            for phase, duration in durations.items():
+                phases[phase].append(duration)
+
+    for phase, samples in phases.items():
+        log_samples(current_test_name, samples, name_prefix=f"{phase}_")
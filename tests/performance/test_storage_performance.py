@@ -0,0 +1,146 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+from perf_helpers import (
+    ITERATIONS,
+    WARMUP_ITERATIONS,
+    execute_commands_concurrently,
+    heavy,
+    log_metric,
+    log_samples,
+    measure,
+)
+from test_helpers import execute_command
+
+DOMAINS = [f"domain-{i}.test" for i in range(10)]
+SOURCE_ORIGIN = "https://source-origin.test"
+# Number of `storage.setCookie` commands in flight at once.
+BATCH_SIZE = 100
+
+
+def get_cookie_name(index: int) -> str:
+    return f"cookie_{index}"
+
+
+def set_cookie_command(index: int, partition: dict) -> dict:
+    return {
+        "method": "storage.setCookie",
+        "params": {
+            "cookie": {
+                "name": get_cookie_name(index),
+                "value": {"type": "string", "value": f"value_{index}"},
+                "domain": DOMAINS[index % len(DOMAINS)],
+                "secure": True,
+            },
+            "partition": partition,
+        },
+    }
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [1_000, pytest.param(10_000, marks=heavy)])
+async def test_performance_bulk_cookies(
+    websocket, user_context_id, current_test_name, count
+):
+    """Sets the given number of cookies spread across the default user context,
+    a source origin partition and another user context, then measures reading
+    them with filters and deleting them."""
+    partitions = [
+        {"type": "storageKey"},
+        {"type": "storageKey", "sourceOrigin": SOURCE_ORIGIN},
+        {"type": "storageKey", "userContext": user_context_id},
+    ]
+    user_context_partition = partitions[2]
+
+    set_latencies = []
+    start_time = time.perf_counter()
+    for batch_start in range(0, count, BATCH_SIZE):
+        set_latencies += await execute_commands_concurrently(
+            websocket,
+            [
+                set_cookie_command(i, partitions[i % len(partitions)])
+                for i in range(batch_start, min(batch_start + BATCH_SIZE, count))
+            ],
+        )
+    set_duration = time.perf_counter() - start_time
+    log_metric(
+        current_test_name,
+        "set_time_per_cookie",
+        set_duration * 1000 / count,
+        "ms/cookie",
+    )
+    log_samples(
+        current_test_name, set_latencies, name_prefix="set_", attach_samples=False
+    )
+
+    get_filters = {
+        "all": {},
+        "name": {"filter": {"name": get_cookie_name(0)}},
+        "domain": {"filter": {"domain": DOMAINS[0]}},
+        "user_context": {"partition": user_context_partition},
+        "user_context_domain": {
+            "partition": user_context_partition,
+            "filter": {"domain": DOMAINS[0]},
+        },
+    }
+    for filter_name, params in get_filters.items():
+
+        async def get_cookies():
+            await execute_command(
+                websocket, {"method": "storage.getCookies", "params": params}
+            )
+
+        log_samples(
+            current_test_name,
+            await measure(get_cookies),
+            name_prefix=f"get_{filter_name}_",
+        )
+
+    # Each iteration deletes another cookie of the user context.
+    names_to_delete = iter(
+        get_cookie_name(i) for i in range(count) if i % len(partitions) == 2
+    )
+
+    async def delete_cookie():
+        await execute_command(
+            websocket,
+            {
+                "method": "storage.deleteCookies",
+                "params": {
+                    "partition": user_context_partition,
+                    "filter": {"name": next(names_to_delete)},
+                },
+            },
+        )
+
+    assert count // len(partitions) >= WARMUP_ITERATIONS + ITERATIONS
+    log_samples(
+        current_test_name, await measure(delete_cookie), name_prefix="delete_name_"
+    )
+
+    start_time = time.perf_counter()
+    for partition in partitions:
+        await execute_command(
+            websocket,
+            {"method": "storage.deleteCookies", "params": {"partition": partition}},
+        )
+    log_metric(
+        current_test_name, "delete_all", (time.perf_counter() - start_time) * 1000
+    )
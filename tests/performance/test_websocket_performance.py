@@ -0,0 +1,177 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+
+import pytest
+import websockets
+from perf_helpers import (
+    ITERATIONS,
+    WARMUP_ITERATIONS,
+    heavy,
+    log_metric,
+    log_samples,
+    measure,
+)
+from test_helpers import (
+    connect_websocket,
+    execute_command,
+    get_tree,
+    goto_url,
+    harness_counters,
+    send_JSON_command,
+    subscribe,
+)
+
+MB = 1024 * 1024
+
+# Options of `connect_websocket`. The screenshot and print responses can be
+# larger than the default `max_size`, so the size is not limited.
+WEBSOCKET_OPTIONS = {
+    "deflate": {"compression": "deflate", "max_size": None},
+    "no_compression": {"compression": None, "max_size": None},
+    "large_buffers": {
+        "compression": None,
+        "max_size": None,
+        "read_limit": MB,
+        "write_limit": MB,
+    },
+}
+EVENTS = 10_000
+
+
+async def capture_screenshot(connection, context_id):
+    await execute_command(
+        connection,
+        {
+            "method": "browsingContext.captureScreenshot",
+            "params": {"origin": "document", "context": context_id},
+        },
+        # Increase timeout for screenshots.
+        timeout=60,
+    )
+
+
+async def print_page(connection, context_id):
+    await execute_command(
+        connection,
+        {"method": "browsingContext.print", "params": {"context": context_id}},
+        timeout=60,
+    )
+
+
+async def receive_event_flood(connection, context_id):
+    await send_JSON_command(
+        connection,
+        {
+            "method": "script.evaluate",
+            "params": {
+                "expression": f"""for (let i = 0; i < {EVENTS}; i++) {{
+                    console.log(i);
+                }}""",
+                "target": {"context": context_id},
+                "awaitPromise": False,
+            },
+        },
+    )
+    # Read the messages directly, as `read_JSON_message` logs every message.
+    received = 0
+    while received < EVENTS:
+        message = json.loads(await connection.recv())
+        if message.get("method") == "log.entryAdded":
+            received += 1
+
+
+WORKLOADS = {
+    "screenshot": capture_screenshot,
+    "print": print_page,
+    "event_flood": receive_event_flood,
+}
+
+# The screenshot and print responses of the long page are several MB. They are
+# measured on every push with the default buffers, and only with the large
+# buffers in the heavy runs.
+CASES = [
+    pytest.param(
+        options,
+        workload,
+        id=f"{options}-{workload}",
+        marks=heavy if options == "large_buffers" and workload != "event_flood" else (),
+    )
+    for options in WEBSOCKET_OPTIONS
+    for workload in WORKLOADS
+]
+
+
+# Timeout 10 minutes.
+@pytest.mark.timeout(10 * 60)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options, workload", CASES)
+async def test_performance_websocket(
+    session_capabilities, html, current_test_name, options, workload
+):
+    """Measures large responses and floods of small events over a connection
+    with the given websocket options. The session is created on its own
+    connection, as the `websocket` fixture uses the default options.
+
+    The `deflate` case is skipped if the server declines the compression, as it
+    would measure the same connection as `no_compression`. This is the case with
+    the node runner: its `websocket` package (WebSocket-Node) does not implement
+    the permessage-deflate extension."""
+    connection = await connect_websocket(**WEBSOCKET_OPTIONS[options])
+    try:
+        if options == "deflate" and not connection.extensions:
+            pytest.skip("The server does not negotiate permessage-deflate.")
+        await execute_command(
+            connection,
+            {
+                "method": "session.new",
+                "params": {"capabilities": {"alwaysMatch": session_capabilities}},
+            },
+            timeout=40,
+        )
+        context_id = (await get_tree(connection))["contexts"][0]["context"]
+
+        if workload == "event_flood":
+            await goto_url(connection, context_id, html("<h1>Benchmark</h1>"))
+            await subscribe(connection, ["log.entryAdded"])
+        else:
+            await goto_url(
+                connection,
+                context_id,
+                f"file://{Path(__file__).parent.resolve()}/resources/long_page.html",
+            )
+
+        # Size of the uncompressed messages, which does not depend on the options.
+        bytes_received = harness_counters["bytes_received"]
+        samples = await measure(lambda: WORKLOADS[workload](connection, context_id))
+        bytes_received = harness_counters["bytes_received"] - bytes_received
+
+        log_samples(current_test_name, samples)
+        log_metric(
+            current_test_name,
+            "received_per_iteration",
+            bytes_received / (WARMUP_ITERATIONS + ITERATIONS) / MB,
+            "MB",
+        )
+        try:
+            await execute_command(connection, {"method": "session.end", "params": {}})
+        except websockets.exceptions.ConnectionClosed:
+            # The runner can close the connection before sending the
+            # `session.end` response. The session is ended either way.
+            pass
+    finally:
+        await connection.close()
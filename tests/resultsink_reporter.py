@@ -13,17 +13,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import gzip
 import html
+import http.client
 import json
 import os
-import urllib.request
+import queue
+import random
+import threading
+import time
+import urllib.parse
+
+from test_helpers import harness_counters
+
+# Maximum number of batches waiting for upload. The test loop blocks when the
+# queue is full.
+MAX_QUEUED_BATCHES = 100
+MAX_ATTEMPTS = 5
 
 
 class ResultSinkReporter:
+    """
+    Uploads the test results to ResultSink in batches. The batches are uploaded
+    in a background thread over a persistent connection, so that a slow sink
+    does not stall the tests.
+    """
+
     def __init__(self):
         self.sink_data = self._get_sink_data()
         self.pending_results = []
         self.batch_size = 50
+        # Base delay in seconds between the upload attempts, with jitter.
+        self.retry_delay = 1.0
+        # Maximum time in seconds to wait for the uploads at the session end.
+        self.flush_timeout = 60.0
+        self.queue = queue.Queue(maxsize=MAX_QUEUED_BATCHES)
+        self.connection = None
+        self.worker = None
+        # Duration in seconds of each phase of the current test.
+        self.phase_durations = {}
+        self.current_result = None
 
     def _get_sink_data(self):
         luci_context = os.environ.get("LUCI_CONTEXT")
@@ -43,30 +73,81 @@ class ResultSinkReporter:
             print(f"Failed to read LUCI_CONTEXT: {e}")
             return None
 
-    def _send_batch(self, batch):
-        if not self.sink_data or not batch:
-            return
+    def _get_connection(self) -> http.client.HTTPConnection:
+        if self.connection is None:
+            url = urllib.parse.urlsplit(self.sink_data["url"])
+            self.connection = http.client.HTTPConnection(url.netloc, timeout=30)
+        return self.connection
 
-        data = json.dumps({"testResults": batch}).encode("utf-8")
-        req = urllib.request.Request(
-            self.sink_data["url"],
-            data=data,
+    def _post(self, body: bytes) -> int:
+        connection = self._get_connection()
+        connection.request(
+            "POST",
+            urllib.parse.urlsplit(self.sink_data["url"]).path,
+            body=body,
             headers={
                 "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
                 "Accept": "application/json",
                 "Authorization": f"ResultSink {self.sink_data['auth_token']}",
             },
         )
-        try:
-            with urllib.request.urlopen(req) as response:
-                response.read()
-        except Exception as e:
-            print(f"Failed to post to ResultSink: {e}")
+        response = connection.getresponse()
+        # Read the whole response to reuse the connection.
+        response.read()
+        return response.status
+
+    def _send_batch(self, batch):
+        if not self.sink_data or not batch:
+            return
+
+        body = gzip.compress(json.dumps({"testResults": batch}).encode("utf-8"))
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                status = self._post(body)
+                if status < 500:
+                    if status != 200:
+                        print(f"Failed to post to ResultSink: HTTP {status}")
+                    return
+                error = f"HTTP {status}"
+            except (http.client.HTTPException, OSError) as e:
+                # Reconnect on the next attempt.
+                self.connection.close()
+                self.connection = None
+                error = e
+            if attempt + 1 < MAX_ATTEMPTS:
+                time.sleep(self.retry_delay * 2**attempt * random.uniform(0.5, 1.5))
+        print(f"Failed to post to ResultSink after {MAX_ATTEMPTS} attempts: {error}")
+
+    def _upload_loop(self):
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                break
+            self._send_batch(batch)
+
+    def _enqueue(self, batch):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._upload_loop, daemon=True)
+            self.worker.start()
+        self.queue.put(batch)
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        harness_counters.clear()
+        self.phase_durations = {}
+        self.current_result = None
 
     def pytest_runtest_logreport(self, report):
         if not self.sink_data:
             return
 
+        self.phase_durations[report.when] = report.duration
+        if report.when == "teardown":
+            if self.current_result is not None:
+                self._add_result(self.current_result)
+                self.current_result = None
+            return
+
         # We only care about the actual call, unless it failed/skipped in setup
         if report.when == "setup" and report.outcome == "skipped":
             status = "SKIP"
@@ -101,16 +182,45 @@ class ResultSinkReporter:
             error_info = html.escape(report.longreprtext)
             test_result["summaryHtml"] = f"<pre>{error_info}</pre>"
 
+        # Reported after the teardown, with its duration and counters.
+        self.current_result = test_result
+
+    def _add_result(self, test_result):
+        counters = {
+            f"{phase}_duration_ms": round(duration * 1000)
+            for phase, duration in self.phase_durations.items()
+        } | dict(harness_counters)
+        test_result["tags"] = [
+            {"key": key, "value": str(value)} for key, value in counters.items()
+        ]
+        test_result["artifacts"] = {
+            "harness_counters": {
+                "contents": base64.b64encode(json.dumps(counters).encode()).decode(),
+                "contentType": "application/json",
+            }
+        }
         self.pending_results.append(test_result)
 
         if len(self.pending_results) >= self.batch_size:
-            self._send_batch(self.pending_results)
+            self._enqueue(self.pending_results)
             self.pending_results = []
 
     def pytest_sessionfinish(self, session, exitstatus):
         if self.pending_results:
-            self._send_batch(self.pending_results)
+            self._enqueue(self.pending_results)
             self.pending_results = []
+        if self.worker is None:
+            return
+        deadline = time.monotonic() + self.flush_timeout
+        try:
+            self.queue.put(None, timeout=self.flush_timeout)
+        except queue.Full:
+            pass
+        self.worker.join(max(0, deadline - time.monotonic()))
+        if self.worker.is_alive():
+            print(f"ResultSink uploads did not finish in {self.flush_timeout}s")
+        elif self.connection is not None:
+            self.connection.close()
 
 
 def pytest_configure(config):
@@ -0,0 +1,178 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any
+
+from syrupy.data import Snapshot, SnapshotCollection
+from syrupy.extensions.base import AbstractSyrupyExtension
+from syrupy.extensions.json import JSONSnapshotExtension
+
+
+class CanonicalJSON:
+    """
+    Snapshot data in the canonical JSON form, i.e. with sorted keys and without
+    whitespace. The data is compared by the hash of the canonical form, and is
+    only pretty-printed for the diffs.
+
+    >>> CanonicalJSON({"b": [1, "x"], "a": None}).canonical
+    '{"a":null,"b":[1,"x"]}'
+    >>> CanonicalJSON({"b": 1, "a": 2}).sha256 == CanonicalJSON({"a": 2, "b": 1}).sha256
+    True
+    >>> print(CanonicalJSON({"b": 1, "a": 2}))
+    {
+      "a": 2,
+      "b": 1
+    }
+    """
+
+    def __init__(self, data: Any, sha256: str | None = None):
+        self.data = data
+        if sha256 is not None:
+            # Stored along with the data, so that the data is not serialized
+            # to match.
+            self.sha256 = sha256
+
+    @cached_property
+    def canonical(self) -> str:
+        return json.dumps(
+            self.data,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=repr,
+        )
+
+    @cached_property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.canonical.encode()).hexdigest()
+
+    def __str__(self) -> str:
+        return json.dumps(
+            self.data, indent=2, sort_keys=True, ensure_ascii=False, default=repr
+        )
+
+
+class CanonicalJSONSnapshotExtension(AbstractSyrupyExtension):
+    """
+    Stores the snapshots of a test module in a single JSON file, indexed by the
+    snapshot name:
+
+        {
+          "test_name": {
+            "data": ...,
+            "sha256": "<hash of the canonical form of the data>"
+          }
+        }
+
+    The file is read once per session, on the first assertion in the module.
+    The assertions compare the hashes of the canonical forms, and only render
+    the pretty-printed JSON if the snapshot does not match.
+    """
+
+    _file_extension = "json"
+
+    def serialize(
+        self, data, *, exclude=None, include=None, matcher=None
+    ) -> CanonicalJSON:
+        return CanonicalJSON(
+            JSONSnapshotExtension._filter(
+                data=data,
+                depth=0,
+                path=(),
+                exclude=exclude,
+                include=include,
+                matcher=matcher,
+            )
+        )
+
+    def matches(
+        self, *, serialized_data: CanonicalJSON, snapshot_data: CanonicalJSON
+    ) -> bool:
+        if serialized_data.sha256 == snapshot_data.sha256:
+            return True
+        # The stored hash can be stale if the file was edited manually.
+        return serialized_data.canonical == snapshot_data.canonical
+
+    @staticmethod
+    def _read_file(snapshot_location: str) -> dict[str, CanonicalJSON]:
+        try:
+            with open(snapshot_location, encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        return {
+            name: CanonicalJSON(entry["data"], entry.get("sha256"))
+            for name, entry in entries.items()
+        }
+
+    @staticmethod
+    def _write_file(snapshot_location: str, snapshots: dict[str, CanonicalJSON]):
+        with open(snapshot_location, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    name: {"data": snapshot.data, "sha256": snapshot.sha256}
+                    for name, snapshot in snapshots.items()
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+                ensure_ascii=False,
+                default=repr,
+            )
+            f.write("\n")
+
+    @classmethod
+    @lru_cache
+    def _read_cached_file(
+        cls, snapshot_location: str, session_id: str
+    ) -> dict[str, CanonicalJSON]:
+        return cls._read_file(snapshot_location)
+
+    def _read_snapshot_data_from_location(
+        self, *, snapshot_location: str, snapshot_name: str, session_id: str
+    ) -> CanonicalJSON | None:
+        return self._read_cached_file(snapshot_location, session_id).get(snapshot_name)
+
+    def _read_snapshot_collection(
+        self, *, snapshot_location: str
+    ) -> SnapshotCollection:
+        snapshot_collection = SnapshotCollection(location=snapshot_location)
+        for name, data in self._read_file(snapshot_location).items():
+            snapshot_collection.add(Snapshot(name=name, data=data))
+        return snapshot_collection
+
+    @classmethod
+    def _write_snapshot_collection(
+        cls, *, snapshot_collection: SnapshotCollection
+    ) -> None:
+        snapshots = cls._read_file(snapshot_collection.location)
+        for snapshot in snapshot_collection:
+            snapshots[snapshot.name] = snapshot.data
+        cls._write_file(snapshot_collection.location, snapshots)
+
+    def delete_snapshots(
+        self, *, snapshot_location: str, snapshot_names: set[str]
+    ) -> None:
+        snapshots = self._read_file(snapshot_location)
+        for name in snapshot_names:
+            snapshots.pop(name, None)
+        if snapshots:
+            self._write_file(snapshot_location, snapshots)
+        else:
+            Path(snapshot_location).unlink()
@@ -0,0 +1,83 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+
+@pytest.mark.timeout(10)
+def test_flaky_rerunner_defers_reruns(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+
+        order = []
+        attempts = {}
+
+        @pytest.fixture(scope="session")
+        def server():
+            order.append("server")
+            yield
+
+        @pytest.fixture(autouse=True)
+        def record(request, server):
+            name = request.node.name
+            attempts[name] = attempts.get(name, 0) + 1
+            order.append(name)
+
+        def test_flaky():
+            # The session fixtures are set up again for the rerun.
+            assert attempts["test_flaky"] > 1 and order.count("server") == 2
+
+        def test_failing():
+            assert False
+
+        def test_passing():
+            pass
+
+        def test_zz_check_order():
+            # The failed tests are not rerun inline.
+            assert order == ["server", "test_flaky", "test_failing", "test_passing",
+                             "test_zz_check_order"]
+        """
+    )
+    db_path = pytester.path / "flakes.sqlite"
+    result = pytester.runpytest_inprocess(
+        "-v", "-p", "flaky_rerunner", "--deferred-reruns=2", f"--flake-db={db_path}"
+    )
+
+    assert result.parseoutcomes() == {"passed": 3, "failed": 1, "rerun": 3}
+    result.stdout.fnmatch_lines(
+        [
+            "*::test_flaky RERUN*",
+            "*::test_failing RERUN*",
+            "*flaky tests*",
+            "*test_flaky passed after 2 attempts, flaky in 1 of 1 recorded runs",
+        ]
+    )
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(
+            "SELECT nodeid, attempts, outcome FROM results ORDER BY nodeid"
+        ).fetchall()
+    connection.close()
+    assert rows == [
+        ("test_flaky_rerunner_defers_reruns.py::test_failing", 3, "failed"),
+        ("test_flaky_rerunner_defers_reruns.py::test_flaky", 2, "flaky"),
+        ("test_flaky_rerunner_defers_reruns.py::test_passing", 1, "passed"),
+        ("test_flaky_rerunner_defers_reruns.py::test_zz_check_order", 1, "passed"),
+    ]
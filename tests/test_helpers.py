@@ -16,14 +16,19 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import io
 import itertools
 import json
 import logging
-from collections.abc import Callable
+import os
+from collections import Counter
+from collections.abc import Callable, Iterator
+from os import PathLike
 from typing import Literal
 from urllib.parse import urlparse
 
+import websockets
 from anys import (
     ANY_NUMBER,
     ANY_STR,
@@ -50,6 +55,88 @@ def get_next_command_id() -> int:
     return next(_command_counter)
 
 
+# Traffic of the harness since the start of the current test, reported by
+# `resultsink_reporter.py`. The sizes are in bytes of the uncompressed messages.
+harness_counters: Counter[str] = Counter()
+
+
+def get_message_size(message: str | bytes) -> int:
+    """
+    Return the size in bytes of the websocket message. Text messages are sent as
+    UTF-8.
+
+    >>> get_message_size('{"text":"ü"}')
+    13
+    >>> get_message_size(b"binary")
+    6
+    """
+    if isinstance(message, str):
+        return len(message.encode())
+    return len(message)
+
+
+class CountingWebSocketClientProtocol(websockets.WebSocketClientProtocol):
+    """
+    Counts the messages of the connection in `harness_counters`. If
+    `recorded_methods` is set, also records the methods of the sent commands and
+    of the received events, see `impact_recorder.py`.
+    """
+
+    recorded_methods: set[str] | None = None
+
+    def _record_method(self, message):
+        try:
+            method = json.loads(message).get("method")
+        except (ValueError, AttributeError):
+            # Some tests send malformed commands on purpose.
+            return
+        if isinstance(method, str):
+            self.recorded_methods.add(method)
+
+    async def send(self, message):
+        harness_counters["commands_sent"] += 1
+        harness_counters["bytes_sent"] += get_message_size(message)
+        if self.recorded_methods is not None:
+            self._record_method(message)
+        await super().send(message)
+
+    async def recv(self):
+        message = await super().recv()
+        harness_counters["bytes_received"] += get_message_size(message)
+        if '"type":"event"' in message:
+            harness_counters["events_received"] += 1
+        if self.recorded_methods is not None:
+            self._record_method(message)
+        return message
+
+
+async def connect_websocket(
+    compression: str | None = "deflate",
+    max_size: int | None = 2**20,
+    read_limit: int = 2**16,
+    write_limit: int = 2**16,
+):
+    """Return a websocket connection to the browser on localhost without an
+    active BiDi session.
+
+    The defaults are the ones of `websockets.connect`. `compression` is the
+    per-message deflate extension offered to the server, or None. `max_size` is
+    the maximum size in bytes of a received message, or None for no limit.
+    `read_limit` and `write_limit` are the high-water marks in bytes of the
+    read and write buffers.
+    """
+    port = os.getenv("PORT", 8080)
+    url = f"ws://localhost:{port}/session"
+    return await websockets.connect(
+        url,
+        create_protocol=CountingWebSocketClientProtocol,
+        compression=compression,
+        max_size=max_size,
+        read_limit=read_limit,
+        write_limit=write_limit,
+    )
+
+
 async def subscribe(
     websocket,
     events: list[str] | str,
@@ -283,6 +370,38 @@ def AnyExtending(expected: list | dict):
     return expected
 
 
+# Decoded reference images, keyed by the SHA-256 of the file content. Values are
+# `(mode, size, rgba_buffer)` tuples.
+_reference_images: dict[str, tuple[str, tuple[int, int], bytes]] = {}
+
+
+def load_reference_image(path_or_content: str | PathLike | bytes) -> Image.Image:
+    """
+    Return the decoded reference image stored at the given path, or given as the
+    file content.
+
+    The decoded pixels are cached for the whole session as raw RGBA buffers keyed
+    by the file content hash, so parametrized and repeated runs do not inflate the
+    same PNG again, while a reference updated on disk is decoded anew.
+    """
+    if isinstance(path_or_content, bytes):
+        content = path_or_content
+    else:
+        with open(path_or_content, "rb") as image_file:
+            content = image_file.read()
+    key = hashlib.sha256(content).hexdigest()
+
+    if key not in _reference_images:
+        with Image.open(io.BytesIO(content)) as img:
+            mode = "RGBA" if img.has_transparency_data else "RGB"
+            rgba = img.convert("RGBA")
+        _reference_images[key] = (mode, rgba.size, rgba.tobytes())
+
+    mode, size, buffer = _reference_images[key]
+    img = Image.frombuffer("RGBA", size, buffer, "raw", "RGBA", 0, 1)
+    return img if mode == "RGBA" else img.convert("RGB")
+
+
 def assert_images_similar(
     img1: Image.Image | str, img2: Image.Image | str, percent=0.90
 ):
@@ -295,29 +414,85 @@ def assert_images_similar(
     equal_size = (img1.height == img2.height) and (img1.width == img2.width)
 
     if img1.mode == img2.mode == "RGBA":
-        img1_alphas = [pixel[3] for pixel in img1.getdata()]
-        img2_alphas = [pixel[3] for pixel in img2.getdata()]
-        equal_alphas = img1_alphas == img2_alphas
+        equal_alphas = img1.getchannel("A").tobytes() == img2.getchannel("A").tobytes()
     else:
         equal_alphas = True
 
-    difference = ImageChops.difference(
-        img1.convert("RGB"), img2.convert("RGB")
-    ).getdata()
-    pixel_count = 0
-    for pixel in difference:
-        if pixel == (0, 0, 0):
-            pixel_count += 1
+    difference = ImageChops.difference(img1.convert("RGB"), img2.convert("RGB"))
+    # A pixel is equal if all its channels are equal, i.e. the max of the channel
+    # differences is 0. Count those via the histogram instead of iterating pixels.
+    red, green, blue = difference.split()
+    max_difference = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+    pixel_count = max_difference.histogram()[0]
 
-    equal_content = pixel_count / len(difference) > percent
+    equal_content = pixel_count / (difference.width * difference.height) > percent
 
     assert equal_alphas
     assert equal_size
     assert equal_content
 
 
+# Number of base64 characters decoded at once. Must be a multiple of 4, so that
+# every chunk except the last one is a complete base64 quantum.
+_BASE64_CHUNK_SIZE = 4 * 1024 * 1024
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PDF_SIGNATURE = b"%PDF"
+
+
+def _iter_decoded_chunks(bytes_or_str: bytes | str) -> Iterator[bytes | memoryview]:
+    """
+    Yield the decoded content of the given bytes or base64 string chunk by chunk,
+    so that the whole decoded payload is never held in memory next to the
+    encoded one.
+
+    >>> b"".join(_iter_decoded_chunks(to_base64("some data")))
+    b'some data'
+    >>> b"".join(_iter_decoded_chunks(b"some data"))
+    b'some data'
+    """
+    if isinstance(bytes_or_str, bytes):
+        yield memoryview(bytes_or_str)
+        return
+    for start in range(0, len(bytes_or_str), _BASE64_CHUNK_SIZE):
+        yield base64.b64decode(
+            bytes_or_str[start : start + _BASE64_CHUNK_SIZE], validate=True
+        )
+
+
+def _save_decoded(bytes_or_str: bytes | str, output_file: str, signature: bytes):
+    """
+    Stream the decoded content to the given output file. Returns `False` without
+    creating the file if the content does not start with the given signature.
+    """
+    chunks = _iter_decoded_chunks(bytes_or_str)
+    first_chunk = next(chunks, b"")
+    if first_chunk[0 : len(signature)] != signature:
+        return False
+
+    with open(output_file, "wb") as f:
+        f.write(first_chunk)
+        for chunk in chunks:
+            f.write(chunk)
+    return True
+
+
 def save_png(png_bytes_or_str: bytes | str, output_file: str):
     """Save the given PNG (bytes or base64 string representation) to the given output file."""
+    # Verified before it is moved to the output file, so that a corrupt PNG is
+    # not left on disk.
+    temp_file = f"{output_file}.tmp"
+    if _save_decoded(png_bytes_or_str, temp_file, _PNG_SIGNATURE):
+        try:
+            with Image.open(temp_file) as img:
+                img.verify()
+            os.replace(temp_file, output_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        return
+
+    # Not a PNG payload. Let Pillow convert it.
     png_bytes = (
         png_bytes_or_str
         if isinstance(png_bytes_or_str, bytes)
@@ -327,17 +502,9 @@ def save_png(png_bytes_or_str: bytes | str, output_file: str):
 
 
 def save_pdf(pdf_bytes_or_str: bytes | str, output_file: str):
-    pdf_bytes = (
-        pdf_bytes_or_str
-        if isinstance(pdf_bytes_or_str, bytes)
-        else base64.b64decode(pdf_bytes_or_str, validate=True)
-    )
-    if pdf_bytes[0:4] != b"%PDF":
+    if not _save_decoded(pdf_bytes_or_str, output_file, _PDF_SIGNATURE):
         raise ValueError("Missing the PDF file signature")
 
-    with open(output_file, "wb") as f:
-        f.write(pdf_bytes)
-
 
 async def create_request_via_fetch(websocket, context_id: str, url: str) -> int:
     return await send_JSON_command(
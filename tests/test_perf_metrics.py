@@ -0,0 +1,142 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import doctest
+import importlib.util
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).parents[1]
+
+
+def load_tool(name):
+    """Import the script from the repository `tools` directory, which is not a
+    package, unlike `tests/tools`."""
+    spec = importlib.util.spec_from_file_location(
+        name, REPO_DIR / "tools" / f"{name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+perf_metrics = load_tool("perf_metrics")
+
+
+def create_metrics(stat, samples, name_prefix=""):
+    name = f"linux-new-node:test_performance{name_prefix}_{stat}"
+    return {
+        "name": name,
+        "value": perf_metrics.compute_stat(samples, stat),
+        "unit": "ms",
+        "extra": "linux-new:e2e-perf-metric",
+        "dimensions": {"metric": name_prefix.removeprefix("_"), "stat": stat},
+        "samples": samples,
+    }
+
+
+def create_samples(seed, factor=1):
+    rng = random.Random(seed)
+    return [factor * (100 + rng.random() * 5) for _ in range(30)]
+
+
+BASELINE = create_samples(0)
+
+
+@pytest.mark.parametrize(
+    "factor, status",
+    [(1.5, "regression"), (1, "no_change"), (0.5, "improvement")],
+)
+def test_perf_metrics_compare(factor, status):
+    candidate = create_samples(1, factor)
+
+    verdict = perf_metrics.compare(
+        [create_metrics("median", BASELINE)],
+        [create_metrics("median", candidate)],
+        ["median"],
+        threshold=5,
+    )
+
+    assert verdict["verdict"] == ("regression" if status == "regression" else "pass")
+    [result] = verdict["metrics"]
+    assert result["series"] == "linux-new-node:test_performance"
+    assert result["stat"] == "median"
+    assert result["status"] == status
+    assert result["diff_rel"] == pytest.approx((factor - 1) * 100, abs=5)
+    assert result["ci_low"] <= result["diff_rel"] <= result["ci_high"]
+
+
+def test_perf_metrics_compare_insufficient_data():
+    verdict = perf_metrics.compare(
+        [create_metrics("median", [100])],
+        [create_metrics("median", [200])],
+        ["median"],
+        threshold=5,
+    )
+
+    [result] = verdict["metrics"]
+    assert verdict["verdict"] == "pass"
+    assert result["status"] == "insufficient_data"
+    assert math.isnan(result["ci_low"]) and math.isnan(result["ci_high"])
+
+
+def test_perf_metrics_compare_prefixed_series():
+    candidate = create_samples(1, 1.5)
+
+    verdict = perf_metrics.compare(
+        [
+            create_metrics(stat, BASELINE, name_prefix="_fetch")
+            for stat in ["mean", "median", "p10", "p90"]
+        ],
+        [
+            create_metrics(stat, candidate, name_prefix="_fetch")
+            for stat in ["mean", "median", "p10", "p90"]
+        ],
+        ["median", "p10"],
+        threshold=5,
+    )
+
+    assert [(result["series"], result["stat"]) for result in verdict["metrics"]] == [
+        ("linux-new-node:test_performance_fetch", "median"),
+        ("linux-new-node:test_performance_fetch", "p10"),
+    ]
+    assert verdict["verdict"] == "regression"
+
+
+def test_perf_metrics_bootstrap_relative_difference():
+    ci_low, ci_high = perf_metrics.bootstrap_relative_difference(
+        BASELINE, create_samples(1, 1.1), "median", resamples=500, rng=random.Random(0)
+    )
+
+    assert 5 < ci_low <= 10 <= ci_high < 15
+    # The relative difference to a zero baseline is undefined.
+    ci_low, ci_high = perf_metrics.bootstrap_relative_difference(
+        [0, 0], [1, 1], "median", resamples=10, rng=random.Random(0)
+    )
+    assert math.isnan(ci_low) and math.isnan(ci_high)
+
+
+@pytest.mark.parametrize("name", ["perf_metrics", "select_e2e_tests"])
+def test_tools_doctests(name, monkeypatch):
+    # The examples of `select_e2e_tests` use paths relative to the repository.
+    monkeypatch.chdir(REPO_DIR)
+
+    results = doctest.testmod(load_tool(name))
+
+    assert results.attempted > 0
+    assert results.failed == 0
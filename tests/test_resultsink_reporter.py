@@ -0,0 +1,173 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import gzip
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from resultsink_reporter import ResultSinkReporter
+from test_helpers import harness_counters
+from werkzeug import Response
+
+SINK_PATH = "/prpc/luci.resultsink.v1.Sink/ReportTestResults"
+
+
+@pytest.fixture
+def create_reporter(httpserver, tmp_path, monkeypatch):
+    """Return a factory of reporters uploading to the stand-in sink server."""
+
+    def create_reporter():
+        luci_context = tmp_path / "luci_context.json"
+        luci_context.write_text(
+            json.dumps(
+                {
+                    "result_sink": {
+                        "address": f"localhost:{httpserver.port}",
+                        "auth_token": "some_token",
+                    }
+                }
+            )
+        )
+        monkeypatch.setenv("LUCI_CONTEXT", str(luci_context))
+        reporter = ResultSinkReporter()
+        reporter.retry_delay = 0.01
+        return reporter
+
+    return create_reporter
+
+
+def report_test(reporter, index):
+    """Reports the phases of a passing test."""
+    nodeid = f"test_{index}"
+    reporter.pytest_runtest_logstart(nodeid, None)
+    for when, duration in [("setup", 0.1), ("call", 0.5), ("teardown", 0.2)]:
+        reporter.pytest_runtest_logreport(
+            SimpleNamespace(
+                nodeid=nodeid,
+                when=when,
+                outcome="passed",
+                duration=duration,
+                longrepr=None,
+            )
+        )
+
+
+def get_uploaded_results(request):
+    return json.loads(gzip.decompress(request.get_data()))["testResults"]
+
+
+@pytest.mark.timeout(10)
+def test_resultsink_reporter_uploads_gzipped_batches(httpserver, create_reporter):
+    httpserver.expect_request(SINK_PATH, method="POST").respond_with_json({})
+    reporter = create_reporter()
+    reporter.batch_size = 2
+
+    for i in range(5):
+        report_test(reporter, i)
+    reporter.pytest_sessionfinish(None, 0)
+
+    assert len(httpserver.log) == 3
+    request, _ = httpserver.log[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Authorization"] == "ResultSink some_token"
+    assert [
+        result["testId"]
+        for request, _ in httpserver.log
+        for result in get_uploaded_results(request)
+    ] == [f"test_{i}" for i in range(5)]
+
+
+@pytest.mark.timeout(10)
+def test_resultsink_reporter_retries(httpserver, create_reporter):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return Response("Unavailable", status=503)
+        return Response("{}", status=200, content_type="application/json")
+
+    httpserver.expect_request(SINK_PATH, method="POST").respond_with_handler(handler)
+    reporter = create_reporter()
+
+    report_test(reporter, 0)
+    reporter.pytest_sessionfinish(None, 0)
+
+    assert len(attempts) == 3
+    assert get_uploaded_results(attempts[-1])[0]["testId"] == "test_0"
+
+
+@pytest.mark.timeout(10)
+def test_resultsink_reporter_flush_deadline(httpserver, create_reporter):
+    def handler(request):
+        time.sleep(1)
+        return Response("{}", status=200, content_type="application/json")
+
+    httpserver.expect_request(SINK_PATH, method="POST").respond_with_handler(handler)
+    reporter = create_reporter()
+    reporter.batch_size = 1
+    reporter.flush_timeout = 0.2
+
+    start_time = time.monotonic()
+    for i in range(3):
+        report_test(reporter, i)
+    # Queuing the batches does not wait for the uploads.
+    assert time.monotonic() - start_time < 0.5
+
+    reporter.pytest_sessionfinish(None, 0)
+    assert time.monotonic() - start_time < 1
+
+    # Do not leak the uploads to the other tests.
+    reporter.worker.join()
+
+
+@pytest.mark.timeout(10)
+def test_resultsink_reporter_phase_durations_and_counters(httpserver, create_reporter):
+    httpserver.expect_request(SINK_PATH, method="POST").respond_with_json({})
+    reporter = create_reporter()
+
+    reporter.pytest_runtest_logstart("test_0", None)
+    harness_counters["commands_sent"] += 3
+    harness_counters["session_creation_attempts"] += 1
+    for when, duration in [("setup", 0.1), ("call", 0.5), ("teardown", 0.2)]:
+        reporter.pytest_runtest_logreport(
+            SimpleNamespace(
+                nodeid="test_0",
+                when=when,
+                outcome="passed",
+                duration=duration,
+                longrepr=None,
+            )
+        )
+    reporter.pytest_sessionfinish(None, 0)
+
+    request, _ = httpserver.log[0]
+    [result] = get_uploaded_results(request)
+    counters = {
+        "setup_duration_ms": 100,
+        "call_duration_ms": 500,
+        "teardown_duration_ms": 200,
+        "commands_sent": 3,
+        "session_creation_attempts": 1,
+    }
+    assert result["duration"] == "0.500s"
+    assert result["tags"] == [
+        {"key": key, "value": str(value)} for key, value in counters.items()
+    ]
+    artifact = result["artifacts"]["harness_counters"]
+    assert json.loads(base64.b64decode(artifact["contents"])) == counters
@@ -0,0 +1,113 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from snapshot_extension import CanonicalJSON, CanonicalJSONSnapshotExtension
+
+pytest_plugins = ["pytester"]
+
+CONFTEST = """
+import pytest
+from snapshot_extension import CanonicalJSONSnapshotExtension
+
+@pytest.fixture
+def snapshot(snapshot):
+    return snapshot.use_extension(CanonicalJSONSnapshotExtension)
+"""
+
+TESTS = """
+import time
+
+from syrupy.filters import props
+
+def test_data(snapshot):
+    assert {{"b": {value}, "a": [1, "x"]}} == snapshot
+
+def test_excluded(snapshot):
+    assert {{"timestamp": time.time(), "c": True}} == snapshot(
+        exclude=props("timestamp")
+    )
+"""
+
+
+def run(pytester, *args):
+    # The files are cached per syrupy session, and the session ids, i.e. the
+    # object ids, can be reused by the in-process runs.
+    CanonicalJSONSnapshotExtension._read_cached_file.cache_clear()
+    return pytester.runpytest_inprocess(*args)
+
+
+@pytest.mark.timeout(10)
+def test_snapshot_extension_round_trip(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_round_trip=TESTS.format(value=1))
+    snapshot_file = pytester.path / "__snapshots__" / "test_round_trip.json"
+
+    result = run(pytester, "--snapshot-update")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*2 snapshots generated*"])
+    assert json.loads(snapshot_file.read_text()) == {
+        "test_data": {
+            "data": {"a": [1, "x"], "b": 1},
+            "sha256": CanonicalJSON({"a": [1, "x"], "b": 1}).sha256,
+        },
+        # The excluded properties are not stored.
+        "test_excluded": {
+            "data": {"c": True},
+            "sha256": CanonicalJSON({"c": True}).sha256,
+        },
+    }
+
+    # The hashes match.
+    result = run(pytester)
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*2 snapshots passed*"])
+
+    # A manually edited file can have stale hashes, the data still matches.
+    snapshots = json.loads(snapshot_file.read_text())
+    snapshots["test_data"]["sha256"] = "stale"
+    snapshot_file.write_text(json.dumps(snapshots))
+    run(pytester).assert_outcomes(passed=2)
+
+    # The mismatch is reported as a diff of the pretty-printed JSON.
+    pytester.makepyfile(test_round_trip=TESTS.format(value=2))
+    result = run(pytester)
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(['*-   "b": 1*', '*+   "b": 2*'])
+
+    # The unused snapshots are deleted, and so is the file without snapshots.
+    pytester.makepyfile(
+        test_round_trip="""
+        def test_data(snapshot):
+            assert {"b": 2, "a": [1, "x"]} == snapshot
+        """
+    )
+    result = run(pytester, "--snapshot-update")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*1 snapshot updated. 1 unused snapshot deleted.*"])
+    assert list(json.loads(snapshot_file.read_text())) == ["test_data"]
+
+    pytester.makepyfile(
+        test_round_trip="""
+        def test_data(snapshot):
+            pass
+        """
+    )
+    result = run(pytester, "--snapshot-update")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*1 unused snapshot deleted*"])
+    assert not snapshot_file.exists()
@@ -0,0 +1,71 @@
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import io
+
+import pytest
+import test_helpers
+from PIL import Image
+from test_helpers import (
+    assert_images_similar,
+    load_reference_image,
+    save_pdf,
+    save_png,
+    to_base64,
+)
+
+
+def test_load_reference_image_cache(tmp_path):
+    path = tmp_path / "reference.png"
+    Image.new("RGBA", (2, 1), (255, 0, 0, 128)).save(path)
+    red = load_reference_image(path)
+    assert red.mode == "RGBA"
+    assert red.getpixel((0, 0)) == (255, 0, 0, 128)
+    assert_images_similar(red, load_reference_image(path))
+    assert_images_similar(red, load_reference_image(path.read_bytes()))
+
+    # Updating the file on disk invalidates the cached image.
+    Image.new("RGB", (2, 1), (0, 0, 255)).save(path)
+    blue = load_reference_image(path)
+    assert blue.mode == "RGB"
+    assert blue.getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_save_pdf_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(test_helpers, "_BASE64_CHUNK_SIZE", 8)
+    pdf_bytes = b"%PDF-1.4 some content spanning several chunks"
+    output_file = tmp_path / "out.pdf"
+
+    save_pdf(base64.b64encode(pdf_bytes).decode(), str(output_file))
+    assert output_file.read_bytes() == pdf_bytes
+
+    with pytest.raises(ValueError):
+        save_pdf(to_base64("not a pdf"), str(tmp_path / "not.pdf"))
+    assert not (tmp_path / "not.pdf").exists()
+
+
+def test_save_png_removes_corrupt_file(tmp_path):
+    png = io.BytesIO()
+    Image.new("RGB", (2, 1), (0, 0, 255)).save(png, "PNG")
+    output_file = tmp_path / "out.png"
+
+    save_png(base64.b64encode(png.getvalue()).decode(), str(output_file))
+    assert output_file.read_bytes() == png.getvalue()
+
+    # Truncated before the image data.
+    with pytest.raises(OSError):
+        save_png(png.getvalue()[:20], str(tmp_path / "corrupt.png"))
+    assert list(tmp_path.iterdir()) == [output_file]
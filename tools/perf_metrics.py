@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tools for the performance metrics written by `tests/performance` and the
+`tools/benchmark-*.mjs` scripts.
+
+Compare a candidate run against a baseline run and flag regressions:
+
+    python tools/perf_metrics.py compare baseline.json candidate.json \
+        --threshold 5 --json-output verdict.json
+
+Combine metrics files into a single JSON list:
+
+    python tools/perf_metrics.py combine *metrics.json --output all.json
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+from collections import defaultdict
+
+# Critical value for 95% confidence intervals. Same as in
+# `tools/benchmark-utils.mjs`.
+T_CRIT_95_LARGE_N = 1.96
+
+PERCENTILES = {"p10": 0.1, "median": 0.5, "p90": 0.9}
+
+
+def parse_metrics(text: str) -> list[dict]:
+    """
+    Parse metrics, either as a JSON list, or as one JSON object per line. Lines
+    may have a trailing comma, as appended by the `tools/benchmark-*.mjs` scripts.
+
+    >>> parse_metrics('[{"name": "a", "value": 1}]')
+    [{'name': 'a', 'value': 1}]
+    >>> parse_metrics('{"name": "a", "value": 1},\\n{"name": "b", "value": 2},\\n')
+    [{'name': 'a', 'value': 1}, {'name': 'b', 'value': 2}]
+    >>> parse_metrics('{"name": "a", "value": 1}\\n{"name": "b", "value": 2}\\n')
+    [{'name': 'a', 'value': 1}, {'name': 'b', 'value': 2}]
+    >>> parse_metrics('')
+    []
+    """
+    text = text.strip()
+    if text.startswith("["):
+        return json.loads(text)
+    return [
+        json.loads(line.strip().rstrip(","))
+        for line in text.splitlines()
+        if line.strip()
+    ]
+
+
+def load_metrics(path: str) -> list[dict]:
+    with open(path) as f:
+        return parse_metrics(f.read())
+
+
+def split_name(name: str) -> tuple[str, str]:
+    """
+    Split the metric name into the series and the statistic.
+
+    >>> split_name("linux-new-node:test_performance_screenshot_p10")
+    ('linux-new-node:test_performance_screenshot', 'p10')
+    """
+    series, _, stat = name.rpartition("_")
+    return series, stat
+
+
+def get_series(metric: dict) -> tuple[str, str]:
+    """
+    Return the series and the statistic of the metric. They are taken from the
+    `metric` and `stat` dimensions if present, and parsed from the name for the
+    metrics logged before, which only had a `stat` dimension with the metric
+    prefix, e.g. `fetch_median`.
+
+    >>> get_series({"name": "o-h-r:test_fetch_median",
+    ...     "dimensions": {"metric": "fetch", "stat": "median"}})
+    ('o-h-r:test_fetch', 'median')
+    >>> get_series({"name": "o-h-r:test_throughput",
+    ...     "dimensions": {"metric": "throughput", "stat": "value"}})
+    ('o-h-r:test_throughput', 'value')
+    >>> get_series({"name": "o-h-r:test_fetch_median",
+    ...     "dimensions": {"stat": "fetch_median"}})
+    ('o-h-r:test_fetch', 'median')
+    """
+    dimensions = metric.get("dimensions", {})
+    if "metric" in dimensions and "stat" in dimensions:
+        stat = dimensions["stat"]
+        return metric["name"].removesuffix(f"_{stat}"), stat
+    return split_name(metric["name"])
+
+
+def percentile(sorted_samples: list[float], p: float) -> float:
+    """Same as `percentile` in `tests/performance/perf_helpers.py`."""
+    return sorted_samples[int(len(sorted_samples) * p)]
+
+
+def compute_stat(samples: list[float], stat: str) -> float:
+    """
+    >>> compute_stat([1, 2, 3, 10], "mean")
+    4
+    >>> compute_stat([1, 2, 3, 10], "value")
+    Traceback (most recent call last):
+    ...
+    ValueError: Unknown statistic: value
+    """
+    if stat == "mean":
+        return statistics.mean(samples)
+    if stat == "median":
+        return statistics.median(samples)
+    if stat not in PERCENTILES:
+        raise ValueError(f"Unknown statistic: {stat}")
+    return percentile(sorted(samples), PERCENTILES[stat])
+
+
+def rank_based_standard_error(sorted_samples: list[float], p: float) -> float:
+    """
+    Port of `calculateRankBasedStandardError` from `tools/benchmark-utils.mjs`.
+    Estimates the standard error of the given percentile from the values at the
+    ranks bounding its 95% confidence interval.
+
+    >>> rank_based_standard_error(list(range(100)), 0.5)
+    5.1020408163265305
+    """
+    count = len(sorted_samples)
+    se_index = math.sqrt(count * p * (1 - p))
+    lower_index = max(0, math.floor(count * p - T_CRIT_95_LARGE_N * se_index))
+    upper_index = min(count - 1, math.ceil(count * p + T_CRIT_95_LARGE_N * se_index))
+    return (sorted_samples[upper_index] - sorted_samples[lower_index]) / (
+        2 * T_CRIT_95_LARGE_N
+    )
+
+
+def bootstrap_relative_difference(
+    baseline: list[float],
+    candidate: list[float],
+    stat: str,
+    resamples: int,
+    rng: random.Random,
+) -> tuple[float, float]:
+    """
+    Return the 95% bootstrap confidence interval of the relative difference of
+    the given statistic between the candidate and the baseline, in percent.
+    """
+    differences = []
+    for _ in range(resamples):
+        baseline_value = compute_stat(rng.choices(baseline, k=len(baseline)), stat)
+        candidate_value = compute_stat(rng.choices(candidate, k=len(candidate)), stat)
+        if baseline_value == 0:
+            continue
+        differences.append((candidate_value / baseline_value - 1) * 100)
+    if not differences:
+        return math.nan, math.nan
+    differences.sort()
+    return (
+        percentile(differences, 0.025),
+        differences[min(len(differences) - 1, math.ceil(len(differences) * 0.975))],
+    )
+
+
+def get_samples(metrics: list[dict]) -> dict[tuple[str, str], list[float]]:
+    """
+    Group the samples by series and statistic. Metrics logged with their raw
+    `samples` provide them directly. Otherwise, the values of all the metrics of
+    the same series, e.g. from repeated runs, are used as samples.
+    """
+    samples = defaultdict(list)
+    for metric in metrics:
+        if "samples" in metric:
+            samples[get_series(metric)].extend(metric["samples"])
+        else:
+            samples[get_series(metric)].append(metric["value"])
+    return samples
+
+
+def compare(
+    baseline_metrics: list[dict],
+    candidate_metrics: list[dict],
+    stats: list[str],
+    threshold: float,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> dict:
+    """
+    Compare the given runs. A metric regresses if the whole 95% confidence
+    interval of its relative difference is above the threshold (in percent).
+    """
+    rng = random.Random(seed)
+    baseline_samples = get_samples(baseline_metrics)
+    candidate_samples = get_samples(candidate_metrics)
+
+    name_by_series = {
+        get_series(metric): metric["name"]
+        for metric in baseline_metrics + candidate_metrics
+    }
+
+    results = []
+    for series, stat in sorted(baseline_samples.keys() & candidate_samples.keys()):
+        if stat not in stats:
+            continue
+        # Metrics with raw samples are aggregated with their statistic. Repeated
+        # plain values, and raw samples of unknown statistics, are aggregated
+        # with the median.
+        has_raw_samples = any(
+            "samples" in metric
+            for metric in baseline_metrics + candidate_metrics
+            if get_series(metric) == (series, stat)
+        )
+        aggregate = (
+            stat
+            if has_raw_samples and (stat == "mean" or stat in PERCENTILES)
+            else "median"
+        )
+        baseline = baseline_samples[series, stat]
+        candidate = candidate_samples[series, stat]
+
+        result = {
+            "name": name_by_series[series, stat],
+            "series": series,
+            "stat": stat,
+            "baseline": compute_stat(baseline, aggregate),
+            "candidate": compute_stat(candidate, aggregate),
+            "baseline_count": len(baseline),
+            "candidate_count": len(candidate),
+        }
+        if aggregate in PERCENTILES:
+            result["baseline_se"] = rank_based_standard_error(
+                sorted(baseline), PERCENTILES[aggregate]
+            )
+            result["candidate_se"] = rank_based_standard_error(
+                sorted(candidate), PERCENTILES[aggregate]
+            )
+
+        if result["baseline"] == 0:
+            result["diff_rel"] = math.nan
+        else:
+            result["diff_rel"] = (result["candidate"] / result["baseline"] - 1) * 100
+
+        if len(baseline) < 2 or len(candidate) < 2:
+            result["ci_low"] = result["ci_high"] = math.nan
+            result["status"] = "insufficient_data"
+        else:
+            result["ci_low"], result["ci_high"] = bootstrap_relative_difference(
+                baseline, candidate, aggregate, resamples, rng
+            )
+            if result["ci_low"] > threshold:
+                result["status"] = "regression"
+            elif result["ci_high"] < -threshold:
+                result["status"] = "improvement"
+            else:
+                result["status"] = "no_change"
+        results.append(result)
+
+    return {
+        "verdict": (
+            "regression"
+            if any(result["status"] == "regression" for result in results)
+            else "pass"
+        ),
+        "threshold": threshold,
+        "metrics": results,
+    }
+
+
+def replace_nan(value):
+    """
+    Replace NaN with `None`, as NaN is not valid JSON.
+
+    >>> replace_nan({"a": [math.nan, 1.0]})
+    {'a': [None, 1.0]}
+    """
+    if isinstance(value, dict):
+        return {key: replace_nan(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [replace_nan(item) for item in value]
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def format_markdown(verdict: dict) -> str:
+    def number(value):
+        return "n/a" if math.isnan(value) else f"{value:.2f}"
+
+    def with_se(result, prefix):
+        value = number(result[prefix])
+        if f"{prefix}_se" not in result:
+            return value
+        return f"{value} ±{number(result[f'{prefix}_se'] * T_CRIT_95_LARGE_N)}"
+
+    lines = [
+        f"**Verdict: {verdict['verdict']}** (threshold: {verdict['threshold']}%)",
+        "",
+        "| Metric | Stat | Baseline | Candidate | Diff | 95% CI | Status |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for result in verdict["metrics"]:
+        lines.append(
+            f"| {result['series']} | {result['stat']} "
+            f"| {with_se(result, 'baseline')} | {with_se(result, 'candidate')} "
+            f"| {number(result['diff_rel'])}% "
+            f"| [{number(result['ci_low'])}%, {number(result['ci_high'])}%] "
+            f"| {result['status']} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def combine(paths: list[str], keep_samples: bool) -> list[dict]:
+    """Concatenate the metrics of the given files."""
+    metrics = []
+    for path in paths:
+        for metric in load_metrics(path):
+            if not keep_samples:
+                metric.pop("samples", None)
+            metrics.append(metric)
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare a candidate run against a baseline run."
+    )
+    compare_parser.add_argument("baseline", help="Metrics file of the baseline run.")
+    compare_parser.add_argument("candidate", help="Metrics file of the candidate run.")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5,
+        help="Minimal relative regression to flag, in percent.",
+    )
+    compare_parser.add_argument(
+        "--stats",
+        default="median,p10",
+        help="Comma-separated statistics to compare.",
+    )
+    compare_parser.add_argument("--resamples", type=int, default=2000)
+    compare_parser.add_argument("--seed", type=int, default=0)
+    compare_parser.add_argument(
+        "--json-output", help="File to write the machine-readable verdict to."
+    )
+
+    combine_parser = subparsers.add_parser(
+        "combine", help="Combine metrics files into a single JSON list."
+    )
+    combine_parser.add_argument("files", nargs="+", help="Metrics files to combine.")
+    combine_parser.add_argument("--output", required=True, help="Output file.")
+    combine_parser.add_argument(
+        "--keep-samples",
+        action="store_true",
+        help="Keep the raw samples, which are not used by the dashboard.",
+    )
+    args = parser.parse_args()
+
+    if args.command == "combine":
+        with open(args.output, "w") as f:
+            json.dump(combine(args.files, args.keep_samples), f, indent=2)
+        return 0
+
+    verdict = compare(
+        load_metrics(args.baseline),
+        load_metrics(args.candidate),
+        args.stats.split(","),
+        args.threshold,
+        args.resamples,
+        args.seed,
+    )
+    if args.json_output:
+        with open(args.json_output, "w") as f:
+            json.dump(replace_nan(verdict), f, indent=2)
+    print(format_markdown(verdict))
+    return 1 if verdict["verdict"] == "regression" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -162,7 +162,9 @@ if (REPEAT_TIMES !== 1) {
   e2eArgs.push(`--count=${REPEAT_TIMES}`);
 }
 if (RERUNS_TIMES !== 0) {
-  e2eArgs.push(`--reruns=${RERUNS_TIMES}`);
+  // Rerun the failed tests at the end, on fresh fixtures. See
+  // `tests/flaky_rerunner.py`.
+  e2eArgs.push(`--deferred-reruns=${RERUNS_TIMES}`);
 }
 if (PYTEST_TOTAL_CHUNKS !== 1) {
   e2eArgs.push(
@@ -196,11 +198,15 @@ if (argv.k) {
 if (argv.s) {
   e2eArgs.push('-s');
 }
+if (process.env.TRACK_MEMORY === 'true') {
+  e2eArgs.push('--track-memory');
+}
 
 const e2eProcess = child_process.spawn('pipenv', e2eArgs, {
   stdio: ['inherit', 'pipe', 'pipe'],
   env: {
     ...process.env,
+    BIDI_SERVER_PID: String(serverProcess.pid),
     BROWSER_BIN: installAndGetChromePath(HEADLESS === 'old'),
     HEADLESS,
   },
@@ -22,6 +22,58 @@ import subprocess
 import sys
 
 
+def sync_file(src, dst):
+    """Hardlinks or copies the file, unless `dst` has the same size and mtime."""
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+        if (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        # A hardlink shares the size and the mtime with the source, so it is
+        # never copied again.
+        os.link(src, dst)
+    except OSError:
+        # Different file systems or no hardlink support.
+        shutil.copy2(src, dst)
+
+
+def sync_tree(src_dir, dst_dir):
+    """
+    Mirrors `src_dir` into `dst_dir` incrementally: only changed files are
+    staged again and the ones removed from `src_dir` are deleted. Symlinks are
+    followed, as with `shutil.copytree`.
+    """
+    for src_root, dir_names, file_names in os.walk(src_dir, followlinks=True):
+        dst_root = os.path.join(dst_dir, os.path.relpath(src_root, src_dir))
+        os.makedirs(dst_root, exist_ok=True)
+
+        expected = set(dir_names) | set(file_names)
+        for entry in os.scandir(dst_root):
+            if entry.name not in expected:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+            elif entry.name in dir_names and not entry.is_dir(follow_symlinks=False):
+                # A file replaced by a directory.
+                os.remove(entry.path)
+            elif entry.name in file_names and entry.is_dir(follow_symlinks=False):
+                # A directory replaced by a file.
+                shutil.rmtree(entry.path)
+
+        for file_name in file_names:
+            sync_file(
+                os.path.join(src_root, file_name), os.path.join(dst_root, file_name)
+            )
+
+
 # Used by Chromium targets to run tests relying on node_modules.
 def main():
     parser = argparse.ArgumentParser()
@@ -40,17 +92,16 @@ def main():
     # Ensure dst_dir exists
     os.makedirs(dst_dir, exist_ok=True)
 
-    # Copy package.json and node_modules to the gen dir
+    # Stage package.json and node_modules in the gen dir. Only the files changed
+    # since the previous run are staged again.
     for name in ["package.json", "node_modules"]:
         src = os.path.join(src_dir, name)
         dst = os.path.join(dst_dir, name)
         if os.path.exists(src):
             if os.path.isdir(src):
-                if os.path.exists(dst):
-                    shutil.rmtree(dst)
-                shutil.copytree(src, dst)
+                sync_tree(src, dst)
             else:
-                shutil.copy2(src, dst)
+                sync_file(src, dst)
 
     node_args = args.args
     if node_args and node_args[0] == "--":
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# Copyright 2026 Google LLC.
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Select the e2e tests affected by the changes since a base revision, using the
+BiDi methods and events recorded per test with `--record-impact`:
+
+    PYTEST_ADDOPTS="--record-impact impact.json" npm run e2e
+    python tools/select_e2e_tests.py impact.json --base origin/main
+
+Prints the node ids of the affected tests, one per line, or `tests` if the
+whole suite has to run, e.g. for changes outside of the mapper modules. Prints
+nothing if no e2e test is affected. The node ids can contain spaces, so pass
+them as separate arguments with `xargs`:
+
+    python tools/select_e2e_tests.py impact.json | xargs -r -d '\n' npm run e2e --
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from functools import cache
+
+MODULES_DIR = "src/bidiMapper/modules/"
+
+# BiDi modules, i.e. the prefixes of the methods and the events, handled by the
+# processors in `src/bidiMapper/modules/<directory>`.
+MODULE_DOMAINS = {
+    "bluetooth": {"bluetooth"},
+    "browser": {"browser"},
+    "digitalCredentials": {"digitalCredentials"},
+    "emulation": {"emulation", "userAgentClientHints"},
+    "input": {"input"},
+    "log": {"log"},
+    "network": {"network"},
+    "permissions": {"permissions"},
+    "speculation": {"speculation"},
+    "storage": {"storage"},
+    "webExtension": {"webExtension"},
+}
+# Not listed modules affect every test: `cdp` with the CDP targets, `session`
+# with the event routing, and `context` and `script`, as the browsing contexts
+# and the realms are used by the other modules, e.g. by the input sandbox. So do
+# the files of the listed modules imported by them, see `get_shared_files`.
+
+# Relative module specifiers of the `import` and `export ... from` statements.
+IMPORT_PATTERN = re.compile(
+    r"^(?:import|export)\b[^;]*?['\"](\.{1,2}/[^'\"]+)['\"]", re.MULTILINE
+)
+
+# Changes which do not affect the e2e tests.
+IGNORED_PREFIXES = ("docs/", "wpt-metadata/", "tests/performance/")
+IGNORED_SUFFIXES = (".md", ".test.ts")
+
+
+def get_domain(method: str) -> str:
+    """
+    >>> get_domain("browsingContext.load")
+    'browsingContext'
+    >>> get_domain("goog:cdp.Debugger.paused")
+    'goog:cdp'
+    """
+    return method.split(".", 1)[0]
+
+
+def get_imports(path: str) -> set[str]:
+    """Return the source files imported by the given one, including the types."""
+    with open(path) as f:
+        source = f.read()
+    imports = set()
+    for specifier in IMPORT_PATTERN.findall(source):
+        imported = os.path.normpath(os.path.join(os.path.dirname(path), specifier))
+        imports.add(imported.removesuffix(".js") + ".ts")
+    return imports
+
+
+@cache
+def get_shared_files() -> frozenset[str]:
+    """
+    Return the source files run for every test: the files of the modules not
+    listed in `MODULE_DOMAINS`, and the files they import, transitively. E.g.
+    `CdpTarget` creates a `LogManager` and reads the `ContextConfigStorage` for
+    every target.
+
+    >>> shared_files = get_shared_files()
+    >>> "src/bidiMapper/modules/log/LogManager.ts" in shared_files
+    True
+    >>> "src/bidiMapper/modules/browser/ContextConfigStorage.ts" in shared_files
+    True
+    >>> "src/bidiMapper/modules/network/NetworkProcessor.ts" in shared_files
+    False
+    """
+    shared_files = set()
+    for module in os.listdir(MODULES_DIR):
+        if module in MODULE_DOMAINS:
+            continue
+        for directory, _, names in os.walk(os.path.join(MODULES_DIR, module)):
+            shared_files.update(
+                os.path.join(directory, name)
+                for name in names
+                if name.endswith(".ts") and not name.endswith(IGNORED_SUFFIXES)
+            )
+    pending = list(shared_files)
+    while pending:
+        for imported in get_imports(pending.pop()):
+            if (
+                imported.startswith(MODULES_DIR)
+                and imported not in shared_files
+                and os.path.exists(imported)
+            ):
+                shared_files.add(imported)
+                pending.append(imported)
+    return frozenset(shared_files)
+
+
+def get_impact(path: str) -> tuple[set[str], set[str]] | None:
+    """
+    Return the BiDi modules and the test files affected by the changed file, or
+    None if every test can be affected.
+
+    >>> get_impact("src/bidiMapper/modules/network/NetworkProcessor.ts")
+    ({'network'}, set())
+    >>> get_impact("src/bidiMapper/modules/network/NetworkStorage.test.ts")
+    (set(), set())
+    >>> get_impact("tests/input/test_input.py")
+    (set(), {'tests/input/test_input.py'})
+    >>> get_impact("tests/input/__snapshots__/test_input.json")
+    (set(), {'tests/input/test_input.py'})
+    >>> get_impact("tests/input/test_removed.py")
+    (set(), set())
+    >>> get_impact("src/bidiMapper/modules/cdp/CdpTarget.ts")
+    >>> get_impact("src/bidiMapper/modules/script/Realm.ts")
+    >>> get_impact("src/bidiMapper/modules/log/LogManager.ts")
+    >>> get_impact("src/bidiMapper/modules/browser/ContextConfigStorage.ts")
+    >>> get_impact("tests/conftest.py")
+    """
+    if path.startswith(IGNORED_PREFIXES) or path.endswith(IGNORED_SUFFIXES):
+        return set(), set()
+    if path.startswith(MODULES_DIR):
+        if path in get_shared_files():
+            return None
+        module = path[len(MODULES_DIR) :].split("/", 1)[0]
+        if module in MODULE_DOMAINS:
+            return MODULE_DOMAINS[module], set()
+        return None
+    directory, name = os.path.split(path)
+    if os.path.basename(directory) == "__snapshots__" and name.endswith(".json"):
+        test_file = f"{os.path.dirname(directory)}/{name[:-5]}.py"
+    elif (
+        path.startswith("tests/") and name.startswith("test_") and name.endswith(".py")
+    ):
+        test_file = path
+    else:
+        return None
+    # The removed test files do not run anymore.
+    return set(), {test_file} if os.path.exists(test_file) else set()
+
+
+def select_tests(
+    impact: dict[str, list[str]], changed_files: list[str]
+) -> list[str] | None:
+    """
+    Return the node ids of the tests affected by the changed files, or None if
+    the whole suite has to run.
+
+    >>> impact = {
+    ...     "tests/a/test_a.py::test_1": ["network.addIntercept", "session.new"],
+    ...     "tests/a/test_a.py::test_2": ["script.evaluate", "session.new"],
+    ...     "tests/log/test_log_entry_added.py::test_3": [
+    ...         "permissions.setPermission", "session.new"],
+    ... }
+    >>> select_tests(impact,
+    ...     ["src/bidiMapper/modules/permissions/PermissionsProcessor.ts"])
+    ['tests/log/test_log_entry_added.py::test_3']
+    >>> select_tests(impact, ["src/bidiMapper/modules/network/NetworkProcessor.ts",
+    ...     "tests/log/test_log_entry_added.py"])
+    ['tests/a/test_a.py::test_1', 'tests/log/test_log_entry_added.py']
+    >>> select_tests(impact, ["README.md"])
+    []
+    >>> select_tests(impact, ["src/bidiMapper/BidiServer.ts"])
+    """
+    domains = set()
+    test_files = set()
+    for path in changed_files:
+        file_impact = get_impact(path)
+        if file_impact is None:
+            return None
+        domains |= file_impact[0]
+        test_files |= file_impact[1]
+
+    selected = [
+        nodeid
+        for nodeid, methods in impact.items()
+        if nodeid.split("::", 1)[0] not in test_files
+        and any(get_domain(method) in domains for method in methods)
+    ]
+    # The changed test files run in full, including the tests not recorded yet.
+    return sorted(selected) + sorted(test_files)
+
+
+def load_impact(paths: list[str]) -> dict[str, list[str]]:
+    """Merge the records of the shards, skipping the removed test files."""
+    impact = {}
+    for path in paths:
+        with open(path) as f:
+            impact |= json.load(f)
+    return {
+        nodeid: methods
+        for nodeid, methods in impact.items()
+        if os.path.exists(nodeid.split("::", 1)[0])
+    }
+
+
+def get_changed_files(base: str) -> list[str]:
+    output = subprocess.check_output(
+        ["git", "diff", "--name-only", "--merge-base", base], text=True
+    )
+    return [line for line in output.splitlines() if line]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "impact", nargs="+", help="Files written by `--record-impact`, per shard."
+    )
+    parser.add_argument(
+        "--base",
+        default="origin/main",
+        help="Revision to compare the working tree against.",
+    )
+    args = parser.parse_args()
+
+    impact_files = [os.path.abspath(path) for path in args.impact]
+    # The paths are relative to the repository root, as the test node ids.
+    os.chdir(os.path.join(os.path.dirname(__file__), ".."))
+    selected = select_tests(load_impact(impact_files), get_changed_files(args.base))
+    if selected is None:
+        print("tests")
+    elif selected:
+        print("\n".join(selected))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())